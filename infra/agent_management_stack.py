@@ -33,7 +33,7 @@ class AgentManagementStack(Stack):
 
         self._config = config
 
-        for key, value in config.tags.items():
+        for key, value in config.tags:
             Tags.of(self).add(key, value)
 
         # --- Lambda Function ---
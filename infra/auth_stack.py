@@ -31,7 +31,7 @@ class AuthStack(Stack):
 
         self._config = config
 
-        for key, value in config.tags.items():
+        for key, value in config.tags:
             Tags.of(self).add(key, value)
 
         # --- Secrets ---
@@ -37,7 +37,7 @@ class CacheStack(Stack):
         self._vpc = vpc
         self._cache_sg = cache_security_group
 
-        for key, value in config.tags.items():
+        for key, value in config.tags:
             Tags.of(self).add(key, value)
 
         # --- Subnet Group ---
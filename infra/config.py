@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnvironmentConfig:
-    """Immutable configuration for a deployment environment."""
+    """Immutable, hashable configuration for a deployment environment."""
 
     stage: str
     aws_account_id: str
@@ -27,6 +27,8 @@ class EnvironmentConfig:
     lambda_runtime_python: str = "python3.11"
     task_lambda_memory_mb: int = 1024
     task_lambda_timeout_seconds: int = 300
+    # Provisioned concurrency on the task processing alias; 0 leaves SnapStart on instead
+    task_provisioned_concurrency: int = 0
 
     # DynamoDB
     dynamodb_billing_mode: str = "PAY_PER_REQUEST"
@@ -41,8 +43,8 @@ class EnvironmentConfig:
     # EventBridge
     event_bus_name: str = "realtime-agentic-api-events"
 
-    # Tags
-    tags: dict[str, str] = field(default_factory=dict)
+    # Tags, as (key, value) pairs so the config stays hashable
+    tags: tuple[tuple[str, str], ...] = ()
 
     @property
     def resource_prefix(self) -> str:
@@ -58,14 +60,14 @@ _ENV_CONFIGS: dict[str, dict[str, object]] = {
         "aws_account_id": "000000000000",
         "aws_region": "us-east-1",
         "nat_gateways": 0,
-        "tags": {"Environment": "dev", "Project": "realtime-agentic-api"},
+        "tags": (("Environment", "dev"), ("Project", "realtime-agentic-api")),
     },
     "staging": {
         "stage": "staging",
         "aws_account_id": "000000000000",
         "aws_region": "us-east-1",
         "nat_gateways": 1,
-        "tags": {"Environment": "staging", "Project": "realtime-agentic-api"},
+        "tags": (("Environment", "staging"), ("Project", "realtime-agentic-api")),
     },
     "prod": {
         "stage": "prod",
@@ -74,8 +76,9 @@ _ENV_CONFIGS: dict[str, dict[str, object]] = {
         "max_azs": 3,
         "nat_gateways": 2,
         "lambda_memory_mb": 512,
+        "task_provisioned_concurrency": 2,
         "cache_node_type": "cache.t3.small",
-        "tags": {"Environment": "prod", "Project": "realtime-agentic-api"},
+        "tags": (("Environment", "prod"), ("Project", "realtime-agentic-api")),
     },
 }
 def get_environment_config(env_name: str) -> EnvironmentConfig:
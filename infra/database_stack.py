@@ -32,7 +32,7 @@ class DatabaseStack(Stack):
 
         self._config = config
 
-        for key, value in config.tags.items():
+        for key, value in config.tags:
             Tags.of(self).add(key, value)
 
         billing = (
@@ -29,7 +29,7 @@ class EventsStack(Stack):
 
         self._config = config
 
-        for key, value in config.tags.items():
+        for key, value in config.tags:
             Tags.of(self).add(key, value)
 
         # --- Event Bus ---
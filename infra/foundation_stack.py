@@ -34,7 +34,7 @@ class FoundationStack(Stack):
         self._config = config
 
         # Apply tags to all resources in the stack
-        for key, value in config.tags.items():
+        for key, value in config.tags:
             Tags.of(self).add(key, value)
 
         # --- VPC ---
@@ -9,6 +9,7 @@ from __future__ import annotations
 from aws_cdk import CfnOutput, Duration, Stack, Tags
 from aws_cdk import aws_dynamodb as dynamodb
 from aws_cdk import aws_events as events
+from aws_cdk import aws_events_targets as targets
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as _lambda
 from aws_cdk import aws_ssm as ssm
@@ -36,7 +37,7 @@ class TaskProcessingStack(Stack):
 
         self._config = config
 
-        for key, value in config.tags.items():
+        for key, value in config.tags:
             Tags.of(self).add(key, value)
 
         # --- Lambda Function ---
@@ -44,6 +45,19 @@ class TaskProcessingStack(Stack):
             agents_table, tasks_table, context_table, event_bus
         )
 
+        # SnapStart and provisioned concurrency both apply to published versions,
+        # so invokers go through this alias.
+        self.task_processing_alias = _lambda.Alias(
+            self,
+            "TaskProcessingLiveAlias",
+            alias_name="live",
+            version=self.task_processing_fn.current_version,
+            provisioned_concurrent_executions=config.task_provisioned_concurrency or None,
+        )
+
+        # --- Warmer ---
+        self._create_warmer_rule()
+
         # --- SSM Parameters ---
         self._publish_ssm_params()
 
@@ -62,7 +76,14 @@ class TaskProcessingStack(Stack):
             self,
             "TaskProcessingFn",
             function_name=self._config.resource_name("task-processing"),
-            runtime=_lambda.Runtime.PYTHON_3_11,
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            architecture=_lambda.Architecture.ARM_64,
+            # Lambda rejects SnapStart on versions with provisioned concurrency.
+            snap_start=(
+                None
+                if self._config.task_provisioned_concurrency
+                else _lambda.SnapStartConf.ON_PUBLISHED_VERSIONS
+            ),
             handler="runtime.handlers.task_processing.handler",
             code=_lambda.Code.from_asset("."),
             memory_size=self._config.task_lambda_memory_mb,
@@ -113,6 +134,22 @@ class TaskProcessingStack(Stack):
 
         return fn
 
+    def _create_warmer_rule(self) -> None:
+        """Ping the live alias every 5 minutes so an initialised container stays warm."""
+        events.Rule(
+            self,
+            "TaskProcessingWarmerRule",
+            rule_name=self._config.resource_name("task-processing-warmer"),
+            description="Keeps the task processing Lambda warm",
+            schedule=events.Schedule.rate(Duration.minutes(5)),
+            targets=[
+                targets.LambdaFunction(
+                    self.task_processing_alias,
+                    event=events.RuleTargetInput.from_object({"warmer": True}),
+                )
+            ],
+        )
+
     def _publish_ssm_params(self) -> None:
         prefix = f"/{self._config.resource_prefix}"
 
@@ -120,16 +157,16 @@ class TaskProcessingStack(Stack):
             self,
             "SsmTaskProcessingFnArn",
             parameter_name=f"{prefix}/task-processing-fn-arn",
-            string_value=self.task_processing_fn.function_arn,
-            description="Task processing Lambda ARN",
+            string_value=self.task_processing_alias.function_arn,
+            description="Task processing Lambda ARN (live alias)",
         )
 
     def _create_outputs(self) -> None:
         CfnOutput(
             self,
             "TaskProcessingFnArn",
-            value=self.task_processing_fn.function_arn,
-            description="Task processing Lambda ARN",
+            value=self.task_processing_alias.function_arn,
+            description="Task processing Lambda ARN (live alias)",
         )
         CfnOutput(
             self,
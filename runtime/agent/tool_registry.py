@@ -7,11 +7,16 @@ validation, execution error handling, and invocation logging.
 from __future__ import annotations
 
 import logging
+import os
 import time
+from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Callable
 
+import orjson
 from strands import tool
 
 logger = logging.getLogger(__name__)
@@ -29,18 +34,26 @@ class ToolValidationError(ToolError):
     """Raised when tool parameters fail validation."""
 
 
-@dataclass(frozen=True)
+# Upper bound on retained ToolInvocation records per registry.
+_DEFAULT_TOOL_LOG_MAX = 1024
+
+# Shared read-only default so parameterless definitions don't each allocate a dict.
+_NO_PARAMETERS: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
     """Metadata and callable for a registered tool."""
 
     name: str
     description: str
     handler: Callable[..., Any]
-    parameters: dict[str, Any] = field(default_factory=dict)
-    required_params: frozenset[str] = field(default_factory=frozenset)
+    # dataclasses reject unhashable defaults, so hand out the singleton via a factory.
+    parameters: Mapping[str, Any] = field(default_factory=lambda: _NO_PARAMETERS)
+    required_params: frozenset[str] = frozenset()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolInvocation:
     """Record of a single tool invocation for logging."""
 
@@ -63,22 +76,44 @@ class ToolInvocation:
             "timestamp": self.timestamp,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize :meth:`to_dict` to JSON bytes; unserializable parameters use ``str``."""
+        return orjson.dumps(self.to_dict(), default=str, option=orjson.OPT_NON_STR_KEYS)
+
 
 class ToolRegistry:
-    """Registry for agent tools with validation and execution."""
+    """Registry for agent tools with validation and execution.
+
+    Tools are stored as parallel lists indexed through ``_name_to_idx`` so
+    the hot paths do one dict lookup and plain list indexing instead of
+    attribute access on per-tool objects. ``_definitions`` holds the
+    ToolDefinition built at registration, which :meth:`get_tool` returns.
+    """
 
     def __init__(self) -> None:
-        self._tools: dict[str, ToolDefinition] = {}
-        self._invocation_log: list[ToolInvocation] = []
+        self._name_to_idx: dict[str, int] = {}
+        self._names: list[str] = []
+        self._handlers: list[Callable[..., Any]] = []
+        self._descriptions: list[str] = []
+        self._parameters: list[dict[str, Any]] = []
+        self._required_params: list[frozenset[str]] = []
+        self._definitions: list[ToolDefinition] = []
+        self._invocation_log: deque[ToolInvocation] = deque(
+            maxlen=int(os.environ.get("TOOL_LOG_MAX", _DEFAULT_TOOL_LOG_MAX))
+        )
+        # Bumped on every register/unregister to invalidate the cached definitions.
+        self._version = 0
+        self._defs_cache_version = -1
+        self._defs_cache: tuple[dict[str, Any], ...] = ()
 
     @property
     def tool_names(self) -> list[str]:
         """Return sorted list of registered tool names."""
-        return sorted(self._tools.keys())
+        return sorted(self._names)
 
     @property
     def invocation_log(self) -> list[ToolInvocation]:
-        """Return the invocation log."""
+        """Return the invocation log (the most recent ``TOOL_LOG_MAX`` entries)."""
         return list(self._invocation_log)
 
     def register(
@@ -102,35 +137,68 @@ class ToolRegistry:
         if not name or not name.strip():
             raise ToolValidationError("Tool name must be non-empty")
 
-        self._tools[name] = ToolDefinition(
+        params = parameters or {}
+        required = required_params or frozenset()
+        definition = ToolDefinition(
             name=name,
             description=description,
             handler=handler,
-            parameters=parameters or {},
-            required_params=required_params or frozenset(),
+            parameters=params,
+            required_params=required,
         )
+        idx = self._name_to_idx.get(name)
+        if idx is None:
+            self._name_to_idx[name] = len(self._names)
+            self._names.append(name)
+            self._handlers.append(handler)
+            self._descriptions.append(description)
+            self._parameters.append(params)
+            self._required_params.append(required)
+            self._definitions.append(definition)
+        else:
+            self._handlers[idx] = handler
+            self._descriptions[idx] = description
+            self._parameters[idx] = params
+            self._required_params[idx] = required
+            self._definitions[idx] = definition
+        self._version += 1
         logger.info("Registered tool: %s", name)
 
     def unregister(self, name: str) -> None:
         """Remove a tool from the registry."""
-        if name not in self._tools:
-            raise ToolNotFoundError(f"Tool '{name}' not found")
-        del self._tools[name]
+        idx = self._index(name)
+        del self._names[idx]
+        del self._handlers[idx]
+        del self._descriptions[idx]
+        del self._parameters[idx]
+        del self._required_params[idx]
+        del self._definitions[idx]
+        del self._name_to_idx[name]
+        # Keep registration order; shift the indices of later tools down.
+        for later in self._names[idx:]:
+            self._name_to_idx[later] -= 1
+        self._version += 1
         logger.info("Unregistered tool: %s", name)
 
+    def _index(self, name: str) -> int:
+        idx = self._name_to_idx.get(name)
+        if idx is None:
+            raise ToolNotFoundError(f"Tool '{name}' not found")
+        return idx
+
     def get_tool(self, name: str) -> ToolDefinition:
         """Get a tool definition by name."""
-        if name not in self._tools:
-            raise ToolNotFoundError(f"Tool '{name}' not found")
-        return self._tools[name]
+        return self._definitions[self._index(name)]
 
     def validate_parameters(self, name: str, params: dict[str, Any]) -> None:
         """Validate parameters against the tool's requirements.
 
         Raises ToolValidationError if required parameters are missing.
         """
-        tool_def = self.get_tool(name)
-        missing = tool_def.required_params - set(params.keys())
+        required = self._required_params[self._index(name)]
+        if not required:
+            return
+        missing = required.difference(params)
         if missing:
             raise ToolValidationError(
                 f"Tool '{name}' missing required parameters: {sorted(missing)}"
@@ -143,52 +211,66 @@ class ToolRegistry:
         and returns the result. Raises ToolError on failure.
         """
         self.validate_parameters(name, params)
-        tool_def = self.get_tool(name)
+        handler = self._handlers[self._name_to_idx[name]]
 
         now = datetime.now(timezone.utc).isoformat()
         start = time.monotonic()
-        invocation = ToolInvocation(
-            tool_name=name,
-            parameters=params,
-            status="running",
-            timestamp=now,
-        )
 
         try:
-            result = tool_def.handler(**params)
-            elapsed_ms = (time.monotonic() - start) * 1000
-            invocation.status = "success"
-            invocation.result = result
-            invocation.duration_ms = elapsed_ms
-            logger.info(
-                "Tool '%s' executed successfully in %.1fms", name, elapsed_ms
-            )
+            result = handler(**params)
         except Exception as exc:
             elapsed_ms = (time.monotonic() - start) * 1000
-            invocation.status = "error"
-            invocation.error = str(exc)
-            invocation.duration_ms = elapsed_ms
             logger.error("Tool '%s' failed after %.1fms: %s", name, elapsed_ms, exc)
-            self._invocation_log.append(invocation)
+            self._invocation_log.append(
+                ToolInvocation(
+                    tool_name=name,
+                    parameters=params,
+                    status="error",
+                    error=str(exc),
+                    duration_ms=elapsed_ms,
+                    timestamp=now,
+                )
+            )
             raise ToolError(f"Tool '{name}' execution failed: {exc}") from exc
 
-        self._invocation_log.append(invocation)
+        elapsed_ms = (time.monotonic() - start) * 1000
+        logger.info(
+            "Tool '%s' executed successfully in %.1fms", name, elapsed_ms
+        )
+        self._invocation_log.append(
+            ToolInvocation(
+                tool_name=name,
+                parameters=params,
+                status="success",
+                result=result,
+                duration_ms=elapsed_ms,
+                timestamp=now,
+            )
+        )
         return result
 
-    def get_tool_definitions_for_agent(self) -> list[dict[str, Any]]:
-        """Return tool definitions formatted for Strands Agent registration."""
-        definitions = []
-        for tool_def in self._tools.values():
-            definitions.append({
-                "name": tool_def.name,
-                "description": tool_def.description,
-                "parameters": tool_def.parameters,
-            })
-        return definitions
+    def _refresh_definitions(self) -> None:
+        if self._defs_cache_version == self._version:
+            return
+        self._defs_cache = tuple(
+            {"name": name, "description": description, "parameters": parameters}
+            for name, description, parameters in zip(
+                self._names, self._descriptions, self._parameters
+            )
+        )
+        self._defs_cache_version = self._version
+
+    def get_tool_definitions_for_agent(self) -> tuple[dict[str, Any], ...]:
+        """Return tool definitions formatted for Strands Agent registration.
+
+        The tuple is cached and shared until the next register/unregister.
+        """
+        self._refresh_definitions()
+        return self._defs_cache
 
     def get_strands_tools(self) -> list[Callable[..., Any]]:
         """Return tool handler callables for Strands Agent tool registration."""
-        return [t.handler for t in self._tools.values()]
+        return self._handlers[:]
 
     def clear_invocation_log(self) -> None:
         """Clear the invocation log."""
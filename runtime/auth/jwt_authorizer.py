@@ -8,6 +8,7 @@ Manager.
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import hmac
 import json
@@ -92,6 +93,18 @@ def _b64url_decode(s: str) -> bytes:
     if padding != 4:
         s += "=" * padding
     return base64.urlsafe_b64decode(s)
+# Keyed HMAC-SHA256 state for the current signing key; copying it skips
+# re-deriving the padded key on every sign/verify within a warm Lambda
+# container. Two slots cover the old and new key during a secret rotation
+# without keeping retired keys in memory.
+@functools.lru_cache(maxsize=2)
+def _keyed_hmac(key: bytes) -> hmac.HMAC:
+    return hmac.new(key, digestmod=hashlib.sha256)
+def _sign(signing_key: str, signing_input: bytes) -> bytes:
+    """Return the HS256 signature of *signing_input* under *signing_key*."""
+    mac = _keyed_hmac(signing_key.encode("utf-8")).copy()
+    mac.update(signing_input)
+    return mac.digest()
 def decode_jwt(token: str, signing_key: str) -> dict[str, Any] | None:
     """Decode and validate an HS256 JWT token.
 
@@ -113,11 +126,7 @@ def decode_jwt(token: str, signing_key: str) -> dict[str, Any] | None:
 
     # Verify signature
     signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
-    expected_sig = hmac.new(
-        signing_key.encode("utf-8"),
-        signing_input,
-        hashlib.sha256,
-    ).digest()
+    expected_sig = _sign(signing_key, signing_input)
 
     try:
         actual_sig = _b64url_decode(signature_b64)
@@ -152,11 +161,7 @@ def create_jwt(payload: dict[str, Any], signing_key: str) -> str:
     header_b64 = _b64url_encode(json.dumps(header, separators=(",", ":")).encode())
     payload_b64 = _b64url_encode(json.dumps(payload, separators=(",", ":")).encode())
     signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
-    signature = hmac.new(
-        signing_key.encode("utf-8"),
-        signing_input,
-        hashlib.sha256,
-    ).digest()
+    signature = _sign(signing_key, signing_input)
     signature_b64 = _b64url_encode(signature)
     return f"{header_b64}.{payload_b64}.{signature_b64}"
 def extract_user_identity(claims: dict[str, Any]) -> dict[str, str]:
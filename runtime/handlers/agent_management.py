@@ -8,9 +8,10 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import Any, ClassVar, TypeVar
 
-from pydantic import BaseModel, Field, ValidationError
+import orjson
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from runtime.auth.middleware import require_permission
 from runtime.repositories.agent_repository import AgentRepository
@@ -30,6 +31,8 @@ from runtime.shared.event_publisher import EventPublisher
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 # Pydantic validation models
 class CreateAgentRequest(BaseModel):
     """Validation model for agent creation requests."""
@@ -45,11 +48,16 @@ class UpdateAgentRequest(BaseModel):
     configuration: dict[str, Any] | None = None
     status: str | None = None
 
-    def model_post_init(self, __context: Any) -> None:
-        if self.status is not None and self.status not in VALID_AGENT_STATUSES:
+    _VALID_STATUSES: ClassVar[frozenset[str]] = VALID_AGENT_STATUSES
+
+    @field_validator("status")
+    @classmethod
+    def _check_status(cls, v: str | None) -> str | None:
+        if v is not None and v not in cls._VALID_STATUSES:
             raise ValueError(
-                f"Invalid status '{self.status}'. Must be one of: {sorted(VALID_AGENT_STATUSES)}"
+                f"Invalid status '{v}'. Must be one of: {sorted(cls._VALID_STATUSES)}"
             )
+        return v
 # Cold-start initialisation
 
 _config: RuntimeConfig | None = None
@@ -76,15 +84,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     path_params = event.get("pathParameters") or {}
     agent_id = path_params.get("agentId")
 
-    routes: dict[tuple[str, bool], Any] = {
-        ("POST", False): _handle_create,
-        ("GET", False): _handle_list,
-        ("GET", True): _handle_get,
-        ("PUT", True): _handle_update,
-        ("DELETE", True): _handle_delete,
-    }
-
-    route_handler = routes.get((http_method, agent_id is not None))
+    route_handler = _ROUTES.get((http_method, agent_id is not None))
     if route_handler is None:
         return _response(405, {"message": f"Method {http_method} not allowed"})
 
@@ -101,14 +101,12 @@ def _handle_create(event: dict[str, Any], context: Any) -> dict[str, Any]:
     auth = _get_auth_context(event)
     user_id = auth["user_id"]
 
-    body = _parse_body(event)
-    if body is None:
-        return _response(400, {"message": "Request body is required"})
-
     try:
-        request = CreateAgentRequest(**body)
+        request = _parse_request(event, CreateAgentRequest)
     except ValidationError as exc:
         return _response(400, {"message": "Validation error", "errors": exc.errors()})
+    if request is None:
+        return _response(400, {"message": "Request body is required"})
 
     configuration = request.configuration
     if request.system_prompt is not None:
@@ -156,7 +154,7 @@ def _handle_list(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     result: dict[str, Any] = {"agents": [_sanitise_item(a) for a in agents]}
     if last_key:
-        result["nextToken"] = json.dumps(last_key)
+        result["nextToken"] = orjson.dumps(last_key).decode()
 
     return _response(200, result)
 @require_permission(PERM_AGENT_READ)
@@ -179,15 +177,12 @@ def _handle_update(event: dict[str, Any], context: Any) -> dict[str, Any]:
     auth = _get_auth_context(event)
     agent_id = event["pathParameters"]["agentId"]
 
-    body = _parse_body(event)
-    if body is None:
-        return _response(400, {"message": "Request body is required"})
-
     try:
-        request = UpdateAgentRequest(**body)
-    except (ValidationError, ValueError) as exc:
-        errors = exc.errors() if isinstance(exc, ValidationError) else [{"msg": str(exc)}]
-        return _response(400, {"message": "Validation error", "errors": errors})
+        request = _parse_request(event, UpdateAgentRequest)
+    except ValidationError as exc:
+        return _response(400, {"message": "Validation error", "errors": exc.errors()})
+    if request is None:
+        return _response(400, {"message": "Request body is required"})
 
     updates: dict[str, Any] = {}
     if request.name is not None:
@@ -229,6 +224,14 @@ def _handle_delete(event: dict[str, Any], context: Any) -> dict[str, Any]:
     )
 
     return _response(204, None)
+# Route table keyed on (HTTP method, has agentId path parameter)
+_ROUTES: dict[tuple[str, bool], Any] = {
+    ("POST", False): _handle_create,
+    ("GET", False): _handle_list,
+    ("GET", True): _handle_get,
+    ("PUT", True): _handle_update,
+    ("DELETE", True): _handle_delete,
+}
 # Helpers
 def _get_auth_context(event: dict[str, Any]) -> dict[str, str]:
     """Extract authorizer context from the API Gateway event."""
@@ -238,17 +241,20 @@ def _get_auth_context(event: dict[str, Any]) -> dict[str, str]:
         "user_id": str(authorizer.get("user_id", "")),
         "role": str(authorizer.get("role", "")),
     }
-def _parse_body(event: dict[str, Any]) -> dict[str, Any] | None:
-    """Parse the JSON body from an API Gateway event."""
+def _parse_request(event: dict[str, Any], model: type[ModelT]) -> ModelT | None:
+    """Validate the API Gateway event body against a Pydantic model.
+
+    String bodies are parsed straight into the model with
+    ``model_validate_json`` so no intermediate dict is built.
+    Returns ``None`` if the event has no body; raises ``ValidationError``
+    for malformed JSON or invalid fields.
+    """
     body = event.get("body")
-    if body is None:
+    if body is None or body == "":
         return None
-    if isinstance(body, str):
-        try:
-            body = json.loads(body)
-        except (json.JSONDecodeError, TypeError):
-            return None
-    return body if isinstance(body, dict) else None
+    if isinstance(body, dict):
+        return model.model_validate(body)
+    return model.model_validate_json(body)
 def _sanitise_item(item: dict[str, Any]) -> dict[str, Any]:
     """Remove DynamoDB key attributes from the response."""
     internal_keys = {"PK", "SK", "GSI1PK", "GSI1SK"}
@@ -263,7 +269,9 @@ def _response(status_code: int, body: Any) -> dict[str, Any]:
         },
     }
     if body is not None:
-        result["body"] = json.dumps(body, default=str)
+        result["body"] = orjson.dumps(
+            body, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
     else:
         result["body"] = ""
     return result
@@ -7,8 +7,10 @@ event publishing for task lifecycle.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
 from typing import Any
 
 from runtime.agent.agent_config import create_agent_from_db_config
@@ -31,43 +33,72 @@ from runtime.shared.event_publisher import EventPublisher
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Cold-start initialisation
+# Event fields that must be present and non-empty before any resource is touched.
+_REQUIRED_FIELDS = ("taskId", "agentId")
+
+
+def _error_response(message: str) -> dict[str, Any]:
+    """Build an error response."""
+    return {
+        "status": "error",
+        "message": message,
+    }
+
+
+# Error messages for each combination of missing fields, keyed by the missing
+# names in _REQUIRED_FIELDS order. Only the strings are shared; each response
+# dict is built per call so callers are free to mutate it.
+_MISSING_FIELDS_MESSAGES: dict[tuple[str, ...], str] = {
+    missing: f"Missing required fields: {', '.join(missing)}"
+    for missing in (("taskId",), ("agentId",), _REQUIRED_FIELDS)
+}
 
-_config: RuntimeConfig | None = None
-_agent_repo: AgentRepository | None = None
-_task_repo: TaskRepository | None = None
-_context_repo: ContextRepository | None = None
-_publisher: EventPublisher | None = None
+# Cold-start initialisation
 
 
+@functools.cache
 def _init() -> (
     tuple[RuntimeConfig, AgentRepository, TaskRepository, ContextRepository, EventPublisher]
 ):
-    """Lazy-initialise shared resources on first invocation."""
-    global _config, _agent_repo, _task_repo, _context_repo, _publisher  # noqa: PLW0603
-    if _config is None:
-        _config = load_runtime_config()
-        _agent_repo = AgentRepository(
-            _config.agents_table,
-            region=_config.aws_region,
-            endpoint_url=_config.dynamodb_endpoint,
-        )
-        _task_repo = TaskRepository(
-            _config.tasks_table,
-            region=_config.aws_region,
-            endpoint_url=_config.dynamodb_endpoint,
-        )
-        _context_repo = ContextRepository(
-            _config.context_table,
-            region=_config.aws_region,
-            endpoint_url=_config.dynamodb_endpoint,
-        )
-        _publisher = EventPublisher(_config)
-    assert _agent_repo is not None
-    assert _task_repo is not None
-    assert _context_repo is not None
-    assert _publisher is not None
-    return _config, _agent_repo, _task_repo, _context_repo, _publisher
+    """Create shared resources once per container and reuse them on warm invocations."""
+    config = load_runtime_config()
+    agent_repo = AgentRepository(
+        config.agents_table,
+        region=config.aws_region,
+        endpoint_url=config.dynamodb_endpoint,
+    )
+    task_repo = TaskRepository(
+        config.tasks_table,
+        region=config.aws_region,
+        endpoint_url=config.dynamodb_endpoint,
+    )
+    context_repo = ContextRepository(
+        config.context_table,
+        region=config.aws_region,
+        endpoint_url=config.dynamodb_endpoint,
+    )
+    return config, agent_repo, task_repo, context_repo, EventPublisher(config)
+
+
+def _register_snapstart_hooks() -> None:
+    """Prime shared resources into a SnapStart snapshot and rebuild them after restore.
+
+    Priming during INIT puts the loaded SDK models and clients in the
+    snapshot; the after-restore hook then drops the clients so the first
+    invocation reconnects instead of reusing snapshotted sockets.
+    """
+    if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") != "snap-start":
+        return
+    try:
+        from snapshot_restore_py import register_after_restore  # type: ignore[import-not-found]
+    except ImportError:
+        # Only present in the Lambda Python runtime.
+        return
+    _init()
+    register_after_restore(_init.cache_clear)
+
+
+_register_snapstart_hooks()
 
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
@@ -88,14 +119,22 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             "agentId": "...",
             "description": "..."
         }
+
+    The scheduled warmer sends ``{"warmer": true}``, which only initialises
+    shared resources.
     """
-    detail = event.get("detail", event)
-    task_id = detail.get("taskId", "")
-    agent_id = detail.get("agentId", "")
+    if event.get("warmer"):
+        # Scheduled keep-warm ping; initialise shared resources and return.
+        _init()
+        return {"warmed": True}
 
-    if not task_id or not agent_id:
-        logger.error("Missing taskId or agentId in event: %s", json.dumps(event))
-        return _error_response("Missing required fields: taskId, agentId")
+    detail = event.get("detail", event)
+    missing = tuple(field for field in _REQUIRED_FIELDS if not detail.get(field))
+    if missing:
+        logger.error("Missing %s in event: %s", ", ".join(missing), json.dumps(event))
+        return _error_response(_MISSING_FIELDS_MESSAGES[missing])
+    task_id = detail["taskId"]
+    agent_id = detail["agentId"]
 
     logger.info("Processing task %s for agent %s", task_id, agent_id)
 
@@ -155,11 +194,13 @@ def _process_task(
     # Update task status to running
     task_repo.update_task_status(agent_id, task_id, TASK_STATUS_RUNNING)
 
-    # Load context
+    # Load context; a fresh agent has no record or empty fields
     context_data = context_repo.get_latest_context(agent_id)
-    conversation_history = (
-        context_data.get("conversationHistory", []) if context_data else []
-    )
+    if context_data:
+        conversation_history = context_data.get("conversationHistory") or []
+        agent_memory = context_data.get("agentMemory") or {}
+    else:
+        conversation_history, agent_memory = [], {}
 
     # Create Strands Agent
     tool_registry = ToolRegistry()
@@ -183,9 +224,9 @@ def _process_task(
     task_failed = False
 
     for idx, step in enumerate(plan.steps):
-        # Publish progress
+        # Queue progress; sent in PutEvents batches ahead of TaskCompleted
         progress_pct = int((idx / max(len(plan.steps), 1)) * 100)
-        publisher.publish_task_progress(
+        publisher.queue_task_progress(
             task_id=task_id,
             agent_id=agent_id,
             progress_pct=progress_pct,
@@ -226,8 +267,7 @@ def _process_task(
     conversation_history.extend(new_messages)
 
     trimmed_history, updated_memory = capabilities.manage_memory(
-        conversation_history,
-        context_data.get("agentMemory", {}) if context_data else {},
+        conversation_history, agent_memory
     )
 
     # Save context
@@ -247,7 +287,8 @@ def _process_task(
     task_repo.update_task_status(agent_id, task_id, final_status)
     task_repo.update_task_result(agent_id, task_id, {"steps": step_results})
 
-    # Publish completion event
+    # Send queued step progress, then the completion event
+    publisher.flush()
     publisher.publish_task_completed(
         task_id=task_id,
         agent_id=agent_id,
@@ -290,6 +331,11 @@ def _handle_task_failure(
     publisher: EventPublisher,
 ) -> None:
     """Handle task failure by updating status and publishing events."""
+    try:
+        # Progress queued before the failure still goes out ahead of TaskCompleted.
+        publisher.flush()
+    except Exception:
+        logger.exception("Failed to flush queued progress for %s", task_id)
     try:
         task_repo.update_task_status(agent_id, task_id, TASK_STATUS_FAILED)
         task_repo.update_task_result(agent_id, task_id, {"error": error})
@@ -307,11 +353,3 @@ def _handle_task_failure(
         )
     except Exception:
         logger.exception("Failed to handle task failure for %s", task_id)
-
-
-def _error_response(message: str) -> dict[str, Any]:
-    """Build an error response."""
-    return {
-        "status": "error",
-        "message": message,
-    }
@@ -13,6 +13,8 @@ import boto3
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
+from runtime.shared.config import BOTO_CLIENT_CONFIG
+
 logger = logging.getLogger(__name__)
 class ItemNotFoundError(Exception):
     """Raised when a requested item does not exist."""
@@ -28,7 +30,7 @@ class BaseRepository:
         region: str | None = None,
         endpoint_url: str | None = None,
     ) -> None:
-        kwargs: dict[str, Any] = {}
+        kwargs: dict[str, Any] = {"config": BOTO_CLIENT_CONFIG}
         if region:
             kwargs["region_name"] = region
         if endpoint_url:
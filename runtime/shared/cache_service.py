@@ -9,16 +9,27 @@ Provides a CacheService class that wraps Redis operations with:
 
 from __future__ import annotations
 
-import json
+import fnmatch
 import logging
 import time
-from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Callable, TypeVar, cast
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Keys are namespaced as "<prefix>:<id>" (e.g. "agent:123"); LocalLRUCache
+# indexes them by that prefix so "agent:*" invalidation needs no full scan.
+_KEY_PREFIX_SEPARATOR = ":"
+_GLOB_CHARS = frozenset("*?[")
+
+# Maximum keys per DEL command when invalidating a pattern in Redis.
+_DELETE_CHUNK_SIZE = 1000
 class CacheError(Exception):
     """Raised when a cache operation fails."""
 @dataclass(frozen=True)
@@ -38,66 +49,124 @@ class LocalLRUCache:
 
     Used when Redis is not available (e.g., local development, testing)
     or as a first-level cache to reduce Redis round trips.
+
+    Expiry times are integer nanoseconds from ``clock`` (``time.monotonic_ns``
+    by default), so they are unaffected by wall-clock adjustments.
+
+    Keys are also indexed by their ``"<prefix>:"`` namespace so that
+    ``delete_pattern("<prefix>:*")`` touches only the matching entries.
     """
 
-    def __init__(self, max_size: int = 1000) -> None:
-        self._cache: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+    def __init__(
+        self,
+        max_size: int = 1000,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        # Plain dicts keep insertion order; the first key is the least recently used.
+        self._data: dict[str, tuple[Any, int | None]] = {}
         self._max_size = max_size
+        self._clock = clock
+        self._prefix_index: dict[str, set[str]] = {}
 
     def get(self, key: str) -> Any | None:
         """Get a value from the cache. Returns None if not found."""
-        if key not in self._cache:
+        entry = self._data.get(key)
+        if entry is None:
             return None
-        if self._is_expired(key):
+        value, expires_at = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            self._remove(key)
             return None
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        return self._cache[key][0]
+        # Re-insert to move to the end (most recently used)
+        self._data[key] = self._data.pop(key)
+        return value
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set a value in the cache with optional TTL."""
-        if key in self._cache:
-            self._cache.move_to_end(key)
-        expires_at = time.time() + ttl if ttl is not None else None
-        self._cache[key] = (value, expires_at)
-        # Evict oldest if over capacity
-        while len(self._cache) > self._max_size:
-            self._cache.popitem(last=False)
+        if key in self._data:
+            # Dropped so the assignment below re-inserts it as most recently used
+            del self._data[key]
+        else:
+            # Evict oldest if at capacity
+            if len(self._data) >= self._max_size:
+                self._remove(next(iter(self._data)))
+            self._prefix_index.setdefault(_key_prefix(key), set()).add(key)
+        expires_at = self._clock() + ttl * _NS_PER_SECOND if ttl is not None else None
+        self._data[key] = (value, expires_at)
 
     def delete(self, key: str) -> bool:
         """Delete a key from the cache. Returns True if key existed."""
-        if key in self._cache:
-            del self._cache[key]
+        if key in self._data:
+            self._remove(key)
             return True
         return False
 
     def exists(self, key: str) -> bool:
         """Check if a key exists in the cache."""
-        if key not in self._cache:
+        entry = self._data.get(key)
+        if entry is None:
             return False
-        if self._is_expired(key):
+        expires_at = entry[1]
+        if expires_at is not None and self._clock() >= expires_at:
+            self._remove(key)
             return False
         return True
 
+    def delete_many(self, keys: list[str]) -> int:
+        """Delete several keys in one pass. Returns the number deleted."""
+        deleted = 0
+        for key in keys:
+            if self._data.pop(key, None) is not None:
+                self._unindex(key)
+                deleted += 1
+        return deleted
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a glob pattern. Returns the number deleted.
+
+        ``"<prefix>:*"`` patterns are served from the prefix index; any
+        other pattern falls back to matching every key.
+        """
+        static = pattern[:-1]
+        if (
+            pattern.endswith("*")
+            and static.endswith(_KEY_PREFIX_SEPARATOR)
+            and _key_prefix(static) == static
+            and _GLOB_CHARS.isdisjoint(static)
+        ):
+            matched = self._prefix_index.pop(static, set())
+        else:
+            matched = {k for k in self._data if fnmatch.fnmatchcase(k, pattern)}
+            for key in matched:
+                self._unindex(key)
+        for key in matched:
+            del self._data[key]
+        return len(matched)
+
     def clear(self) -> None:
         """Clear all entries from the cache."""
-        self._cache.clear()
+        self._data.clear()
+        self._prefix_index.clear()
 
     def size(self) -> int:
         """Return the current number of entries in the cache."""
-        return len(self._cache)
-
-    def _is_expired(self, key: str) -> bool:
-        value = self._cache.get(key)
-        if value is None:
-            return True
-        expires_at = value[1]
-        if expires_at is None:
-            return False
-        if time.time() >= expires_at:
-            self._cache.pop(key, None)
-            return True
-        return False
+        return len(self._data)
+
+    def _remove(self, key: str) -> None:
+        del self._data[key]
+        self._unindex(key)
+
+    def _unindex(self, key: str) -> None:
+        prefix = _key_prefix(key)
+        bucket = self._prefix_index.get(prefix)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._prefix_index[prefix]
+def _key_prefix(key: str) -> str:
+    """Return the ``"<prefix>:"`` namespace of *key* ("" if it has none)."""
+    head, sep, _ = key.partition(_KEY_PREFIX_SEPARATOR)
+    return head + sep if sep else ""
 @dataclass
 class CacheService:
     """Cache service with cache-aside pattern support.
@@ -132,6 +201,20 @@ class CacheService:
             self._use_local_only = True
             logger.info("CacheService initialized in local-only mode")
 
+        if self._use_local_only:
+            self._bind_local_operations()
+
+    def _bind_local_operations(self) -> None:
+        """Route the core operations straight to the local cache.
+
+        The backend is fixed once construction finishes, so local-only
+        instances skip the Redis checks and JSON serialization on every call.
+        """
+        self.get = self._local_cache.get  # type: ignore[method-assign]
+        self.set = self._set_local  # type: ignore[method-assign]
+        self.delete = self._local_cache.delete  # type: ignore[method-assign]
+        self.exists = self._local_cache.exists  # type: ignore[method-assign]
+
     def _connect(self) -> None:
         """Establish connection to Redis."""
         if self.config is None:
@@ -173,9 +256,6 @@ class CacheService:
         if local_value is not None:
             return local_value
 
-        if self._use_local_only or self._client is None:
-            return None
-
         try:
             raw_value = self._client.get(key)
             if raw_value is None:
@@ -203,9 +283,6 @@ class CacheService:
         # Always update local cache
         self._local_cache.set(key, value, ttl)
 
-        if self._use_local_only or self._client is None:
-            return True
-
         try:
             if ttl is not None:
                 self._client.setex(key, ttl, serialized)
@@ -224,9 +301,6 @@ class CacheService:
         # Always delete from local cache
         local_deleted = self._local_cache.delete(key)
 
-        if self._use_local_only or self._client is None:
-            return local_deleted
-
         try:
             result = self._client.delete(key)
             return bool(result > 0) or local_deleted
@@ -239,15 +313,17 @@ class CacheService:
         if self._local_cache.exists(key):
             return True
 
-        if self._use_local_only or self._client is None:
-            return False
-
         try:
             return bool(self._client.exists(key))
         except Exception as exc:
             logger.warning("Cache exists check failed for key %s: %s", key, exc)
             return False
 
+    def _set_local(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Local-only ``set``: no serialization or Redis round trip."""
+        self._local_cache.set(key, value, ttl)
+        return True
+
     # Cache-Aside Pattern
 
     def get_or_fetch(
@@ -295,28 +371,32 @@ class CacheService:
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all keys matching a pattern.
 
-        Uses Redis SCAN to find matching keys (avoids blocking KEYS command).
+        Uses Redis SCAN to find matching keys (avoids blocking KEYS command),
+        then deletes them through a single non-transactional pipeline.
         Returns the number of keys deleted.
 
-        Note: In local-only mode, the local cache is cleared and the number
-        of cleared entries is returned.
+        Note: In local-only mode, matching keys are removed from the local
+        cache and the number of removed entries is returned.
         """
         if self._use_local_only or self._client is None:
-            deleted_count = self._local_cache.size()
-            self._local_cache.clear()
-            return deleted_count
+            return self._local_cache.delete_pattern(pattern)
 
         try:
-            deleted_count = 0
+            keys: list[str] = []
             cursor = 0
             while True:
-                cursor, keys = self._client.scan(cursor=cursor, match=pattern, count=100)
-                if keys:
-                    deleted_count += self._client.delete(*keys)
-                    for key in keys:
-                        self._local_cache.delete(key)
+                cursor, batch = self._client.scan(cursor=cursor, match=pattern, count=100)
+                keys.extend(batch)
                 if cursor == 0:
                     break
+            if not keys:
+                return 0
+
+            pipe = self._client.pipeline(transaction=False)
+            for start in range(0, len(keys), _DELETE_CHUNK_SIZE):
+                pipe.delete(*keys[start : start + _DELETE_CHUNK_SIZE])
+            deleted_count = sum(int(n) for n in pipe.execute())
+            self._local_cache.delete_many(keys)
             return deleted_count
         except Exception as exc:
             logger.warning("Cache invalidate_pattern failed for %s: %s", pattern, exc)
@@ -324,13 +404,13 @@ class CacheService:
 
     # Serialization
 
-    def _serialize(self, value: Any) -> str:
-        """Serialize a value to JSON string."""
-        return json.dumps(value, default=str)
+    def _serialize(self, value: Any) -> bytes:
+        """Serialize a value to JSON bytes (Redis accepts bytes as-is)."""
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
 
-    def _deserialize(self, raw: str) -> Any:
-        """Deserialize a JSON string to a Python object."""
-        return json.loads(raw)
+    def _deserialize(self, raw: str | bytes) -> Any:
+        """Deserialize a JSON string or bytes to a Python object."""
+        return orjson.loads(raw)
 
     # Health Check
 
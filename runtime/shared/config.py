@@ -9,6 +9,16 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 
+from botocore.config import Config
+
+# Shared botocore settings for long-lived Lambda clients: adaptive retries,
+# TCP keepalive on pooled connections and a short connect timeout.
+BOTO_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=1,
+)
+
 
 @dataclass(frozen=True)
 class RuntimeConfig:
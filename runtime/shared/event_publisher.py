@@ -13,7 +13,7 @@ from typing import Any
 
 import boto3
 
-from runtime.shared.config import RuntimeConfig
+from runtime.shared.config import BOTO_CLIENT_CONFIG, RuntimeConfig
 from runtime.shared.constants import (
     EVENT_AGENT_CREATED,
     EVENT_AGENT_DELETED,
@@ -33,6 +33,9 @@ from runtime.shared.constants import (
 )
 
 logger = logging.getLogger(__name__)
+
+# PutEvents accepts at most 10 entries per request.
+_PUT_EVENTS_BATCH_SIZE = 10
 class EventValidationError(Exception):
     """Raised when event data fails validation."""
 class EventPublisher:
@@ -44,10 +47,14 @@ class EventPublisher:
 
     def __init__(self, config: RuntimeConfig) -> None:
         self._bus_name = config.event_bus_name
-        kwargs: dict[str, Any] = {"region_name": config.aws_region}
+        kwargs: dict[str, Any] = {
+            "region_name": config.aws_region,
+            "config": BOTO_CLIENT_CONFIG,
+        }
         if config.eventbridge_endpoint:
             kwargs["endpoint_url"] = config.eventbridge_endpoint
         self._client = boto3.client("events", **kwargs)
+        self._queue: list[dict[str, Any]] = []
 
     # Public helpers
 
@@ -145,22 +152,48 @@ class EventPublisher:
         message: str | None = None,
     ) -> str:
         """Publish a TaskProgress event."""
-        self._require("task_id", task_id)
-        self._require("agent_id", agent_id)
-        if not 0 <= progress_pct <= 100:
-            raise EventValidationError(
-                f"progress_pct must be 0-100, got {progress_pct}"
-            )
-
-        detail: dict[str, Any] = {
-            "taskId": task_id,
-            "agentId": agent_id,
-            "progressPct": progress_pct,
-        }
-        if message is not None:
-            detail["message"] = message
+        detail = self._task_progress_detail(task_id, agent_id, progress_pct, message)
         return self._put_event(EVENT_SOURCE_TASKS, EVENT_TASK_PROGRESS, detail)
 
+    def queue_task_progress(
+        self,
+        task_id: str,
+        agent_id: str,
+        progress_pct: int,
+        *,
+        message: str | None = None,
+    ) -> None:
+        """Validate a TaskProgress event and hold it until :meth:`flush`."""
+        detail = self._task_progress_detail(task_id, agent_id, progress_pct, message)
+        self._queue.append(self._entry(EVENT_SOURCE_TASKS, EVENT_TASK_PROGRESS, detail))
+
+    def flush(self) -> list[str]:
+        """Send queued events, up to 10 per PutEvents call.
+
+        Every chunk is attempted even if an earlier one fails, and the queue
+        is left empty either way, so failed entries are not resent by a later
+        flush.
+
+        Returns:
+            The EventBridge entry IDs in queue order.
+
+        Raises:
+            Exception: The first chunk's error, once all chunks were attempted.
+        """
+        entries, self._queue = self._queue, []
+        event_ids: list[str] = []
+        first_error: Exception | None = None
+        for start in range(0, len(entries), _PUT_EVENTS_BATCH_SIZE):
+            chunk = entries[start : start + _PUT_EVENTS_BATCH_SIZE]
+            try:
+                event_ids.extend(self._put_entries(chunk))
+            except Exception as exc:
+                logger.exception("PutEvents failed for %d queued entries", len(chunk))
+                first_error = first_error or exc
+        if first_error is not None:
+            raise first_error
+        return event_ids
+
     def publish_status_changed(
         self,
         agent_id: str,
@@ -233,26 +266,58 @@ class EventPublisher:
         if not value or not value.strip():
             raise EventValidationError(f"'{name}' must be a non-empty string")
 
+    def _task_progress_detail(
+        self,
+        task_id: str,
+        agent_id: str,
+        progress_pct: int,
+        message: str | None,
+    ) -> dict[str, Any]:
+        self._require("task_id", task_id)
+        self._require("agent_id", agent_id)
+        if not 0 <= progress_pct <= 100:
+            raise EventValidationError(
+                f"progress_pct must be 0-100, got {progress_pct}"
+            )
+
+        detail: dict[str, Any] = {
+            "taskId": task_id,
+            "agentId": agent_id,
+            "progressPct": progress_pct,
+        }
+        if message is not None:
+            detail["message"] = message
+        return detail
+
+    def _entry(self, source: str, detail_type: str, detail: dict[str, Any]) -> dict[str, Any]:
+        """Stamp *detail* and wrap it as a PutEvents entry."""
+        detail["timestamp"] = datetime.now(timezone.utc).isoformat()
+        return {
+            "Source": source,
+            "DetailType": detail_type,
+            "Detail": json.dumps(detail),
+            "EventBusName": self._bus_name,
+        }
+
     def _put_event(self, source: str, detail_type: str, detail: dict[str, Any]) -> str:
         """Send a single event entry to EventBridge and return the entry ID."""
-        detail["timestamp"] = datetime.now(timezone.utc).isoformat()
+        return self._put_entries([self._entry(source, detail_type, detail)])[0]
 
-        response = self._client.put_events(
-            Entries=[
-                {
-                    "Source": source,
-                    "DetailType": detail_type,
-                    "Detail": json.dumps(detail),
-                    "EventBusName": self._bus_name,
-                }
-            ]
-        )
+    def _put_entries(self, entries: list[dict[str, Any]]) -> list[str]:
+        """Send up to 10 entries in one PutEvents call and return their entry IDs."""
+        response = self._client.put_events(Entries=entries)
 
         failed = response.get("FailedEntryCount", 0)
         if failed:
-            entries = response.get("Entries", [{}])
-            error_code = entries[0].get("ErrorCode", "Unknown")
-            error_msg = entries[0].get("ErrorMessage", "Unknown error")
+            results = response.get("Entries", [{}])
+            index, error = next(
+                ((i, r) for i, r in enumerate(results) if r.get("ErrorCode")),
+                (0, results[0]),
+            )
+            error_code = error.get("ErrorCode", "Unknown")
+            error_msg = error.get("ErrorMessage", "Unknown error")
+            source = entries[index]["Source"]
+            detail_type = entries[index]["DetailType"]
             logger.error(
                 "EventBridge put_events failed: %s - %s (source=%s, detail_type=%s)",
                 error_code,
@@ -264,11 +329,13 @@ class EventPublisher:
                 f"Failed to publish event {detail_type}: {error_code} - {error_msg}"
             )
 
-        entry_id: str = response["Entries"][0]["EventId"]
-        logger.info(
-            "Published event %s/%s (id=%s)",
-            source,
-            detail_type,
-            entry_id,
-        )
-        return entry_id
+        entry_ids: list[str] = []
+        for entry, result in zip(entries, response["Entries"]):
+            entry_ids.append(result["EventId"])
+            logger.info(
+                "Published event %s/%s (id=%s)",
+                entry["Source"],
+                entry["DetailType"],
+                result["EventId"],
+            )
+        return entry_ids
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import time
 from typing import Any
 
 import boto3
@@ -16,14 +18,41 @@ from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
-_secret_cache: dict[str, str] = {}
+# secret name -> (value, time.monotonic() at fetch)
+_secret_cache: dict[str, tuple[str, float]] = {}
 _secrets_clients: dict[str | None, Any] = {}
-def get_secret(secret_name: str, region: str | None = None) -> str:
+
+# BatchGetSecretValue accepts at most 20 entries in SecretIdList.
+_BATCH_SIZE = 20
+
+# Matches the Powertools Parameters default so rotated secrets are picked up.
+DEFAULT_MAX_AGE_S = 300.0
+def _get_client(region: str | None) -> Any:
+    client = _secrets_clients.get(region)
+    if client is None:
+        client = boto3.client("secretsmanager", region_name=region)
+        _secrets_clients[region] = client
+    return client
+# Lambda always sets AWS_REGION; building the default client here moves its
+# construction into the INIT phase instead of the first invocation.
+if "AWS_REGION" in os.environ:
+    _get_client(None)
+def _cached(secret_name: str, max_age_s: float) -> str | None:
+    entry = _secret_cache.get(secret_name)
+    if entry is None or time.monotonic() - entry[1] >= max_age_s:
+        return None
+    return entry[0]
+def get_secret(
+    secret_name: str,
+    region: str | None = None,
+    max_age_s: float = DEFAULT_MAX_AGE_S,
+) -> str:
     """Retrieve a plain-text secret from Secrets Manager (with in-memory cache).
 
     Args:
         secret_name: Full secret name or ARN.
         region: AWS region override.
+        max_age_s: Refetch when the cached value is at least this many seconds old.
 
     Returns:
         The secret string value.
@@ -31,34 +60,94 @@ def get_secret(secret_name: str, region: str | None = None) -> str:
     Raises:
         ClientError: If the secret cannot be retrieved.
     """
-    if secret_name in _secret_cache:
-        return _secret_cache[secret_name]
+    cached = _cached(secret_name, max_age_s)
+    if cached is not None:
+        return cached
 
-    client = _secrets_clients.get(region)
-    if client is None:
-        client = boto3.client("secretsmanager", region_name=region)
-        _secrets_clients[region] = client
+    client = _get_client(region)
     try:
         response = client.get_secret_value(SecretId=secret_name)
         value: str = response["SecretString"]
-        _secret_cache[secret_name] = value
+        _secret_cache[secret_name] = (value, time.monotonic())
         return value
     except ClientError:
         logger.exception("Failed to retrieve secret: %s", secret_name)
         raise
-def get_secret_json(secret_name: str, region: str | None = None) -> dict[str, Any]:
+def get_secrets(
+    names: list[str],
+    region: str | None = None,
+    *,
+    as_json: bool = False,
+    max_age_s: float = DEFAULT_MAX_AGE_S,
+) -> dict[str, Any]:
+    """Retrieve several secrets with one BatchGetSecretValue call per 20 names.
+
+    Fetched values land in the same cache as :func:`get_secret`.  Names the
+    batch reports under ``Errors`` are logged and left uncached, so a later
+    :func:`get_secret` for them still raises ``ClientError``.
+
+    Args:
+        names: Secret names or ARNs.
+        region: AWS region override.
+        as_json: Parse each secret string as JSON.
+        max_age_s: Refetch cached values at least this many seconds old.
+
+    Returns:
+        Mapping of requested name to value for every secret retrieved.
+
+    Raises:
+        ClientError: If a batch request itself fails.
+    """
+    values = {name: _cached(name, max_age_s) for name in dict.fromkeys(names)}
+    missing = [name for name, value in values.items() if value is None]
+    if missing:
+        client = _get_client(region)
+        for start in range(0, len(missing), _BATCH_SIZE):
+            chunk = missing[start : start + _BATCH_SIZE]
+            requested = set(chunk)
+            try:
+                response = client.batch_get_secret_value(SecretIdList=chunk)
+            except ClientError:
+                logger.exception("Failed to batch retrieve secrets: %s", chunk)
+                raise
+            for entry in response.get("SecretValues", []):
+                key = entry["ARN"] if entry.get("ARN") in requested else entry["Name"]
+                _secret_cache[key] = (entry["SecretString"], time.monotonic())
+                if key in values:
+                    values[key] = entry["SecretString"]
+            for error in response.get("Errors", []):
+                logger.error(
+                    "Failed to retrieve secret %s: %s",
+                    error.get("SecretId"),
+                    error.get("ErrorCode"),
+                )
+
+    if as_json:
+        return {name: json.loads(raw) for name, raw in values.items() if raw is not None}
+    return {name: raw for name, raw in values.items() if raw is not None}
+def get_secret_json(
+    secret_name: str,
+    region: str | None = None,
+    max_age_s: float = DEFAULT_MAX_AGE_S,
+) -> dict[str, Any]:
     """Retrieve a JSON-encoded secret and parse it.
 
     Args:
         secret_name: Full secret name or ARN.
         region: AWS region override.
+        max_age_s: Refetch when the cached value is at least this many seconds old.
 
     Returns:
         Parsed JSON object.
     """
-    raw = get_secret(secret_name, region)
+    raw = get_secret(secret_name, region, max_age_s)
     return json.loads(raw)
 def clear_cache() -> None:
-    """Clear the in-memory secret cache (useful for testing)."""
+    """Clear the in-memory secret cache (useful for testing).
+
+    Clients are kept so a refetch does not pay for client construction again.
+    """
     _secret_cache.clear()
+def _reset_clients() -> None:
+    """Drop cached clients so tests can substitute ``boto3.client``."""
     _secrets_clients.clear()
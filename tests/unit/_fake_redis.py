@@ -0,0 +1,87 @@
+"""Minimal in-memory stand-in for ``redis.Redis``.
+
+Implements only the commands ``CacheService`` issues and records each call
+as ``(method, args, kwargs)`` so tests can assert on plain tuples instead of
+``MagicMock`` call history.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from dataclasses import dataclass, field
+from typing import Any
+
+Call = tuple[str, tuple[Any, ...], dict[str, Any]]
+@dataclass
+class FakePipeline:
+    """Buffers commands and runs them against the parent on ``execute()``."""
+
+    redis: FakeRedis
+    calls: list[Call] = field(default_factory=list)
+
+    def delete(self, *keys: str) -> FakePipeline:
+        self.calls.append(("delete", keys, {}))
+        return self
+
+    def execute(self) -> list[Any]:
+        self.redis.calls.append(("execute", (), {}))
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+@dataclass
+class FakeRedis:
+    """Dict-backed Redis client covering ping/get/set/setex/delete/exists/scan."""
+
+    store: dict[str, Any] = field(default_factory=dict)
+    calls: list[Call] = field(default_factory=list)
+    pipelines: list[FakePipeline] = field(default_factory=list)
+
+    def _record(self, method: str, *args: Any, **kwargs: Any) -> None:
+        self.calls.append((method, args, kwargs))
+
+    def ping(self) -> bool:
+        self._record("ping")
+        return True
+
+    def get(self, key: str) -> Any:
+        self._record("get", key)
+        return self.store.get(key)
+
+    def set(self, key: str, value: Any) -> bool:
+        self._record("set", key, value)
+        self.store[key] = value
+        return True
+
+    def setex(self, key: str, ttl: int, value: Any) -> bool:
+        self._record("setex", key, ttl, value)
+        self.store[key] = value
+        return True
+
+    def delete(self, *keys: str) -> int:
+        self._record("delete", *keys)
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def exists(self, *keys: str) -> int:
+        self._record("exists", *keys)
+        return sum(key in self.store for key in keys)
+
+    def scan(
+        self, cursor: int = 0, match: str | None = None, count: int = 10
+    ) -> tuple[int, list[str]]:
+        """Page through matching keys; the cursor is an offset into the sorted key list."""
+        self._record("scan", cursor=cursor, match=match, count=count)
+        keys = sorted(k for k in self.store if match is None or fnmatch.fnmatchcase(k, match))
+        page = keys[cursor : cursor + count]
+        next_cursor = cursor + count if cursor + count < len(keys) else 0
+        return next_cursor, page
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        self._record("pipeline", transaction=transaction)
+        pipe = FakePipeline(self)
+        self.pipelines.append(pipe)
+        return pipe
+
+    def info(self, section: str | None = None) -> dict[str, Any]:
+        self._record("info", section)
+        return {"used_memory_human": "1M"}
+
+    def close(self) -> None:
+        self._record("close")
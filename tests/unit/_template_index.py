@@ -0,0 +1,56 @@
+"""Plain-dict lookups over synthesized CDK templates.
+
+``Template.has_resource_properties`` and ``resource_count_is`` re-run the
+assertions matcher over every resource of a type on each call.  These
+helpers index the template JSON by resource type once and let tests assert
+with ordinary dict lookups.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aws_cdk.assertions import Template
+
+# id(template) -> (template, {resource type: {logical id: resource}}).
+# The template is held alongside its index so the id() key cannot be reused.
+_INDEXES: dict[int, tuple[Template, dict[str, dict[str, dict[str, Any]]]]] = {}
+def resource_index(template: Template) -> dict[str, dict[str, dict[str, Any]]]:
+    """Return the template's resources grouped by type and keyed on logical ID."""
+    entry = _INDEXES.get(id(template))
+    if entry is None:
+        index: dict[str, dict[str, dict[str, Any]]] = {}
+        for logical_id, resource in template.to_json().get("Resources", {}).items():
+            index.setdefault(resource["Type"], {})[logical_id] = resource
+        entry = (template, index)
+        _INDEXES[id(template)] = entry
+    return entry[1]
+def resources_of(template: Template, resource_type: str) -> dict[str, dict[str, Any]]:
+    """Return every resource of *resource_type*, keyed on logical ID."""
+    return resource_index(template).get(resource_type, {})
+def properties_of(template: Template, resource_type: str) -> list[dict[str, Any]]:
+    """Return the ``Properties`` of every resource of *resource_type*."""
+    return [
+        resource.get("Properties", {})
+        for resource in resources_of(template, resource_type).values()
+    ]
+def find_resource(template: Template, resource_type: str, **expected: Any) -> dict[str, Any]:
+    """Return the first resource whose top-level keys (e.g. ``DeletionPolicy``) match *expected*.
+
+    Raises:
+        AssertionError: If no resource of *resource_type* matches.
+    """
+    for resource in resources_of(template, resource_type).values():
+        if all(resource.get(key) == value for key, value in expected.items()):
+            return resource
+    raise AssertionError(f"No {resource_type} resource with attributes {expected}")
+def find_properties(template: Template, resource_type: str, **expected: Any) -> dict[str, Any]:
+    """Return the properties of the first resource whose top-level values match *expected*.
+
+    Raises:
+        AssertionError: If no resource of *resource_type* matches.
+    """
+    for props in properties_of(template, resource_type):
+        if all(props.get(key) == value for key, value in expected.items()):
+            return props
+    raise AssertionError(f"No {resource_type} resource with properties {expected}")
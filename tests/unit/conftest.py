@@ -0,0 +1,103 @@
+"""Shared fixtures for unit tests."""
+
+from __future__ import annotations
+
+import importlib.util
+import types
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from infra.config import EnvironmentConfig
+
+if TYPE_CHECKING:
+    import aws_cdk as cdk
+    from aws_cdk.assertions import Template
+
+    # Adds the stack under test (and any stacks it needs) to the App and returns it.
+    StackBuilder = Callable[[cdk.App, EnvironmentConfig, cdk.Environment], cdk.Stack]
+
+# CDK stack tests import aws_cdk at module level; where it is not installed,
+# leave them out of collection instead of failing each module on ImportError.
+if importlib.util.find_spec("aws_cdk") is None:
+    collect_ignore_glob = ["test_*_stack.py"]
+
+
+@pytest.fixture()
+def handler_mocks() -> types.SimpleNamespace:
+    """Pre-built config/repository/publisher mocks for Lambda handler tests."""
+    return types.SimpleNamespace(config=MagicMock(), repo=MagicMock(), publisher=MagicMock())
+
+
+@pytest.fixture(scope="session")
+def cdk_warmup() -> None:
+    """Start the JSII runtime once per worker so its startup is reported as setup time."""
+    # Imported lazily so runtime-only test runs never pay for loading aws_cdk.
+    import aws_cdk as cdk
+
+    cdk.App()
+
+
+DEV_CONFIG = EnvironmentConfig(
+    stage="dev",
+    aws_account_id="123456789012",
+    aws_region="us-east-1",
+    nat_gateways=0,
+    tags=(("Environment", "dev"),),
+)
+
+PROD_CONFIG = EnvironmentConfig(
+    stage="prod",
+    aws_account_id="123456789012",
+    aws_region="us-east-1",
+    max_azs=3,
+    nat_gateways=2,
+    tags=(("Environment", "prod"),),
+)
+
+
+def synth_templates(build_stack: StackBuilder, *configs: EnvironmentConfig) -> dict[str, Template]:
+    """Build one stack per config in a single App, synthesize once, and key templates by stage."""
+    import aws_cdk as cdk
+    from aws_cdk.assertions import Template
+
+    app = cdk.App()
+    stacks = {
+        config.stage: build_stack(
+            app,
+            config,
+            cdk.Environment(account=config.aws_account_id, region=config.aws_region),
+        )
+        for config in configs
+    }
+    assembly = app.synth()
+    return {
+        stage: Template.from_json(assembly.get_stack_by_name(stack.stack_name).template)
+        for stage, stack in stacks.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def stack_configs() -> tuple[EnvironmentConfig, ...]:
+    """Configs synthesized by ``templates``; override in a module that needs other settings."""
+    return (DEV_CONFIG, PROD_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def templates(
+    build_stack: StackBuilder, stack_configs: tuple[EnvironmentConfig, ...]
+) -> dict[str, Template]:
+    """Templates for the module's ``build_stack`` fixture, shared by all of its tests."""
+    return synth_templates(build_stack, *stack_configs)
+
+
+@pytest.fixture(scope="module")
+def dev_template(templates: dict[str, Template]) -> Template:
+    return templates["dev"]
+
+
+@pytest.fixture(scope="module")
+def prod_template(templates: dict[str, Template]) -> Template:
+    return templates["prod"]
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import json
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from runtime.handlers import agent_management as mod
 from runtime.repositories.base_repository import ItemNotFoundError
@@ -33,6 +35,15 @@ def mock_env(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("CONTEXT_TABLE", "test-context")
     monkeypatch.setenv("CONNECTIONS_TABLE", "test-connections")
     monkeypatch.setenv("EVENT_BUS_NAME", "test-bus")
+@pytest.fixture()
+def mock_init(handler_mocks: SimpleNamespace):
+    """Patch ``_init`` to return the shared handler mocks."""
+    with patch.object(
+        mod,
+        "_init",
+        return_value=(handler_mocks.config, handler_mocks.repo, handler_mocks.publisher),
+    ) as m:
+        yield m
 def _api_event(
     method: str,
     body: dict[str, Any] | None = None,
@@ -60,40 +71,45 @@ def _api_event(
 class TestRouting:
     """Test request routing logic."""
 
-    @patch.object(mod, "_handle_create")
-    def test_post_routes_to_create(self, mock_create: MagicMock):
-        mock_create.return_value = {"statusCode": 201}
+    def test_post_routes_to_create(self):
+        mock_create = MagicMock(return_value={"statusCode": 201})
         event = _api_event("POST")
-        result = mod.handler(event, None)
+        with patch.dict(mod._ROUTES, {("POST", False): mock_create}):
+            result = mod.handler(event, None)
         assert result["statusCode"] == 201
+        mock_create.assert_called_once_with(event, None)
 
-    @patch.object(mod, "_handle_list")
-    def test_get_without_id_routes_to_list(self, mock_list: MagicMock):
-        mock_list.return_value = {"statusCode": 200}
+    def test_get_without_id_routes_to_list(self):
+        mock_list = MagicMock(return_value={"statusCode": 200})
         event = _api_event("GET")
-        result = mod.handler(event, None)
+        with patch.dict(mod._ROUTES, {("GET", False): mock_list}):
+            result = mod.handler(event, None)
         assert result["statusCode"] == 200
+        mock_list.assert_called_once_with(event, None)
 
-    @patch.object(mod, "_handle_get")
-    def test_get_with_id_routes_to_get(self, mock_get: MagicMock):
-        mock_get.return_value = {"statusCode": 200}
+    def test_get_with_id_routes_to_get(self):
+        mock_get = MagicMock(return_value={"statusCode": 200})
         event = _api_event("GET", path_params={"agentId": "a1"})
-        result = mod.handler(event, None)
+        with patch.dict(mod._ROUTES, {("GET", True): mock_get}):
+            result = mod.handler(event, None)
         assert result["statusCode"] == 200
+        mock_get.assert_called_once_with(event, None)
 
-    @patch.object(mod, "_handle_update")
-    def test_put_routes_to_update(self, mock_update: MagicMock):
-        mock_update.return_value = {"statusCode": 200}
+    def test_put_routes_to_update(self):
+        mock_update = MagicMock(return_value={"statusCode": 200})
         event = _api_event("PUT", path_params={"agentId": "a1"})
-        result = mod.handler(event, None)
+        with patch.dict(mod._ROUTES, {("PUT", True): mock_update}):
+            result = mod.handler(event, None)
         assert result["statusCode"] == 200
+        mock_update.assert_called_once_with(event, None)
 
-    @patch.object(mod, "_handle_delete")
-    def test_delete_routes_to_delete(self, mock_delete: MagicMock):
-        mock_delete.return_value = {"statusCode": 204}
+    def test_delete_routes_to_delete(self):
+        mock_delete = MagicMock(return_value={"statusCode": 204})
         event = _api_event("DELETE", path_params={"agentId": "a1"})
-        result = mod.handler(event, None)
+        with patch.dict(mod._ROUTES, {("DELETE", True): mock_delete}):
+            result = mod.handler(event, None)
         assert result["statusCode"] == 204
+        mock_delete.assert_called_once_with(event, None)
 
     def test_unsupported_method_returns_405(self):
         event = _api_event("PATCH")
@@ -103,11 +119,10 @@ class TestRouting:
 class TestCreateAgent:
     """Test agent creation handler."""
 
-    @patch.object(mod, "_init")
-    def test_create_agent_success(self, mock_init: MagicMock):
-        repo = MagicMock()
-        publisher = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, publisher)
+    @pytest.mark.usefixtures("mock_init")
+    def test_create_agent_success(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
+        publisher = handler_mocks.publisher
 
         agent_item = {
             "PK": "AGENT#a1",
@@ -133,25 +148,21 @@ class TestCreateAgent:
             agent_id="a1", user_id="user-1", agent_name="TestAgent"
         )
 
-    @patch.object(mod, "_init")
-    def test_create_agent_missing_body(self, mock_init: MagicMock):
-        mock_init.return_value = (MagicMock(), MagicMock(), MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_create_agent_missing_body(self):
         event = _api_event("POST")
         result = mod._handle_create(event, None)
         assert result["statusCode"] == 400
 
-    @patch.object(mod, "_init")
-    def test_create_agent_missing_name(self, mock_init: MagicMock):
-        mock_init.return_value = (MagicMock(), MagicMock(), MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_create_agent_missing_name(self):
         event = _api_event("POST", body={"configuration": {}})
         result = mod._handle_create(event, None)
         assert result["statusCode"] == 400
 
-    @patch.object(mod, "_init")
-    def test_create_agent_with_system_prompt_and_tools(self, mock_init: MagicMock):
-        repo = MagicMock()
-        publisher = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, publisher)
+    @pytest.mark.usefixtures("mock_init")
+    def test_create_agent_with_system_prompt_and_tools(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
 
         repo.create_agent.return_value = {
             "agentId": "a2",
@@ -173,10 +184,9 @@ class TestCreateAgent:
 class TestGetAgent:
     """Test single-agent retrieval handler."""
 
-    @patch.object(mod, "_init")
-    def test_get_agent_success(self, mock_init: MagicMock):
-        repo = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_get_agent_success(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
 
         repo.get_agent.return_value = {
             "agentId": "a1",
@@ -191,10 +201,9 @@ class TestGetAgent:
         body = json.loads(result["body"])
         assert body["agentId"] == "a1"
 
-    @patch.object(mod, "_init")
-    def test_get_agent_not_found(self, mock_init: MagicMock):
-        repo = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_get_agent_not_found(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
         repo.get_agent.side_effect = ItemNotFoundError("not found")
 
         event = _api_event("GET", path_params={"agentId": "missing"})
@@ -204,10 +213,9 @@ class TestGetAgent:
 class TestListAgents:
     """Test agent listing handler."""
 
-    @patch.object(mod, "_init")
-    def test_list_agents_success(self, mock_init: MagicMock):
-        repo = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_list_agents_success(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
 
         repo.list_agents_by_user.return_value = (
             [{"agentId": "a1", "name": "Agent1"}],
@@ -222,10 +230,9 @@ class TestListAgents:
         assert len(body["agents"]) == 1
         assert "nextToken" not in body
 
-    @patch.object(mod, "_init")
-    def test_list_agents_with_pagination(self, mock_init: MagicMock):
-        repo = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_list_agents_with_pagination(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
 
         last_key = {"PK": "AGENT#a1", "SK": "METADATA"}
         repo.list_agents_by_user.return_value = (
@@ -237,15 +244,14 @@ class TestListAgents:
         result = mod._handle_list(event, None)
 
         body = json.loads(result["body"])
-        assert "nextToken" in body
+        assert json.loads(body["nextToken"]) == last_key
 # Tests: Update Agent
 class TestUpdateAgent:
     """Test agent update handler."""
 
-    @patch.object(mod, "_init")
-    def test_update_agent_success(self, mock_init: MagicMock):
-        repo = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_update_agent_success(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
 
         repo.update_agent.return_value = {
             "agentId": "a1",
@@ -260,26 +266,23 @@ class TestUpdateAgent:
         body = json.loads(result["body"])
         assert body["name"] == "Updated"
 
-    @patch.object(mod, "_init")
-    def test_update_agent_not_found(self, mock_init: MagicMock):
-        repo = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_update_agent_not_found(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
         repo.update_agent.side_effect = ItemNotFoundError("not found")
 
         event = _api_event("PUT", path_params={"agentId": "a1"}, body={"name": "X"})
         result = mod._handle_update(event, None)
         assert result["statusCode"] == 404
 
-    @patch.object(mod, "_init")
-    def test_update_agent_invalid_status(self, mock_init: MagicMock):
-        mock_init.return_value = (MagicMock(), MagicMock(), MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_update_agent_invalid_status(self):
         event = _api_event("PUT", path_params={"agentId": "a1"}, body={"status": "bogus"})
         result = mod._handle_update(event, None)
         assert result["statusCode"] == 400
 
-    @patch.object(mod, "_init")
-    def test_update_agent_empty_body(self, mock_init: MagicMock):
-        mock_init.return_value = (MagicMock(), MagicMock(), MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_update_agent_empty_body(self):
         event = _api_event("PUT", path_params={"agentId": "a1"}, body={})
         result = mod._handle_update(event, None)
         assert result["statusCode"] == 400
@@ -287,11 +290,10 @@ class TestUpdateAgent:
 class TestDeleteAgent:
     """Test agent deletion handler."""
 
-    @patch.object(mod, "_init")
-    def test_delete_agent_success(self, mock_init: MagicMock):
-        repo = MagicMock()
-        publisher = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, publisher)
+    @pytest.mark.usefixtures("mock_init")
+    def test_delete_agent_success(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
+        publisher = handler_mocks.publisher
 
         event = _api_event("DELETE", path_params={"agentId": "a1"})
         result = mod._handle_delete(event, None)
@@ -302,10 +304,9 @@ class TestDeleteAgent:
             agent_id="a1", user_id="user-1"
         )
 
-    @patch.object(mod, "_init")
-    def test_delete_agent_not_found(self, mock_init: MagicMock):
-        repo = MagicMock()
-        mock_init.return_value = (MagicMock(), repo, MagicMock())
+    @pytest.mark.usefixtures("mock_init")
+    def test_delete_agent_not_found(self, handler_mocks: SimpleNamespace):
+        repo = handler_mocks.repo
         repo.delete_agent.side_effect = ItemNotFoundError("not found")
 
         event = _api_event("DELETE", path_params={"agentId": "missing"})
@@ -340,20 +341,27 @@ class TestHelpers:
         result = mod._sanitise_item(item)
         assert result == {"agentId": "a1"}
 
-    def test_parse_body_json_string(self):
+    def test_parse_request_json_string(self):
         event = {"body": '{"name": "test"}'}
-        result = mod._parse_body(event)
-        assert result == {"name": "test"}
+        result = mod._parse_request(event, mod.CreateAgentRequest)
+        assert result is not None
+        assert result.name == "test"
 
-    def test_parse_body_none(self):
+    def test_parse_request_dict_body(self):
+        event = {"body": {"name": "test"}}
+        result = mod._parse_request(event, mod.CreateAgentRequest)
+        assert result is not None
+        assert result.name == "test"
+
+    def test_parse_request_none(self):
         event = {}
-        result = mod._parse_body(event)
+        result = mod._parse_request(event, mod.CreateAgentRequest)
         assert result is None
 
-    def test_parse_body_invalid_json(self):
+    def test_parse_request_invalid_json(self):
         event = {"body": "not json"}
-        result = mod._parse_body(event)
-        assert result is None
+        with pytest.raises(ValidationError):
+            mod._parse_request(event, mod.CreateAgentRequest)
 
     def test_response_format(self):
         result = mod._response(200, {"key": "value"})
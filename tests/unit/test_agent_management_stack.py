@@ -1,6 +1,7 @@
 """Unit tests for the Agent Management CDK stack."""
 
 import aws_cdk as cdk
+import pytest
 from aws_cdk import aws_dynamodb as dynamodb
 from aws_cdk import aws_events as events
 from aws_cdk.assertions import Match, Template
@@ -8,6 +9,8 @@ from aws_cdk.assertions import Match, Template
 from infra.agent_management_stack import AgentManagementStack
 from infra.config import EnvironmentConfig
 
+pytestmark = pytest.mark.usefixtures("cdk_warmup")
+
 
 def _dev_config() -> EnvironmentConfig:
     return EnvironmentConfig(
@@ -15,7 +18,7 @@ def _dev_config() -> EnvironmentConfig:
         aws_account_id="123456789012",
         aws_region="us-east-1",
         nat_gateways=0,
-        tags={"Environment": "dev"},
+        tags=(("Environment", "dev"),),
     )
 def _synth_template(config: EnvironmentConfig | None = None) -> Template:
     config = config or _dev_config()
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import hashlib
 import json
-import os
 from typing import Any
 from unittest.mock import patch
 
+import pytest
+
 from runtime.auth.api_key_authorizer import (
     _hash_key,
     handler,
@@ -45,6 +46,10 @@ class TestValidateApiKey:
         result = validate_api_key("", keys)
         assert result is None
 class TestApiKeyAuthorizerHandler:
+    @pytest.fixture(autouse=True)
+    def _env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("API_KEYS_SECRET_NAME", "test/api-keys")
+
     def _token_event(self, api_key: str) -> dict[str, Any]:
         return {
             "type": "TOKEN",
@@ -59,7 +64,6 @@ class TestApiKeyAuthorizerHandler:
             "methodArn": _METHOD_ARN,
         }
 
-    @patch.dict(os.environ, {"API_KEYS_SECRET_NAME": "test/api-keys"})
     @patch("runtime.auth.api_key_authorizer.get_secret")
     def test_valid_token_authorizer(self, mock_get_secret: Any) -> None:
         raw_key = "my-api-key-123"
@@ -73,7 +77,6 @@ class TestApiKeyAuthorizerHandler:
         assert result["context"]["role"] == "admin"
         assert result["context"]["auth_type"] == "api_key"
 
-    @patch.dict(os.environ, {"API_KEYS_SECRET_NAME": "test/api-keys"})
     @patch("runtime.auth.api_key_authorizer.get_secret")
     def test_valid_request_authorizer(self, mock_get_secret: Any) -> None:
         raw_key = "my-api-key-123"
@@ -85,7 +88,6 @@ class TestApiKeyAuthorizerHandler:
         stmt = result["policyDocument"]["Statement"][0]
         assert stmt["Effect"] == "Allow"
 
-    @patch.dict(os.environ, {"API_KEYS_SECRET_NAME": "test/api-keys"})
     @patch("runtime.auth.api_key_authorizer.get_secret")
     def test_invalid_key_denied(self, mock_get_secret: Any) -> None:
         mock_get_secret.return_value = json.dumps(_make_valid_keys("correct-key"))
@@ -96,7 +98,6 @@ class TestApiKeyAuthorizerHandler:
         stmt = result["policyDocument"]["Statement"][0]
         assert stmt["Effect"] == "Deny"
 
-    @patch.dict(os.environ, {"API_KEYS_SECRET_NAME": "test/api-keys"})
     def test_missing_token_denied(self) -> None:
         event = {"methodArn": _METHOD_ARN}
         result = handler(event, None)
@@ -105,9 +106,8 @@ class TestApiKeyAuthorizerHandler:
         stmt = result["policyDocument"]["Statement"][0]
         assert stmt["Effect"] == "Deny"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_missing_env_var_denied(self) -> None:
-        # Clear ALL env vars to ensure API_KEYS_SECRET_NAME is missing
+    def test_missing_env_var_denied(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("API_KEYS_SECRET_NAME", raising=False)
         event = self._token_event("some-key")
         result = handler(event, None)
 
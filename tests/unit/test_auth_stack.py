@@ -1,157 +1,107 @@
 """Unit tests for the Auth CDK stack."""
 
+from collections.abc import Callable
+
 import aws_cdk as cdk
-from aws_cdk.assertions import Match, Template
+import pytest
+from aws_cdk.assertions import Template
 
 from infra.auth_stack import AuthStack
 from infra.config import EnvironmentConfig
+from tests.unit._template_index import find_properties, find_resource, resources_of
 
+pytestmark = pytest.mark.usefixtures("cdk_warmup")
 
-def _synth_template(config: EnvironmentConfig) -> Template:
-    app = cdk.App()
-    stack = AuthStack(
-        app,
-        "TestAuth",
-        config=config,
-        env=cdk.Environment(account=config.aws_account_id, region=config.aws_region),
-    )
-    return Template.from_stack(stack)
-def _dev_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="dev",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        nat_gateways=0,
-        tags={"Environment": "dev"},
-    )
-def _prod_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="prod",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        max_azs=3,
-        nat_gateways=2,
-        tags={"Environment": "prod"},
-    )
+
+@pytest.fixture(scope="module")
+def build_stack() -> Callable[..., cdk.Stack]:
+    def build(app: cdk.App, config: EnvironmentConfig, env: cdk.Environment) -> cdk.Stack:
+        stack_id = f"TestAuth{config.stage.capitalize()}"
+        return AuthStack(app, stack_id, config=config, env=env)
+
+    return build
 class TestAuthStackSecrets:
     """Tests for authentication secrets."""
 
-    def test_two_secrets_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::SecretsManager::Secret", 2)
+    def test_two_secrets_created(self, dev_template: Template) -> None:
+        assert len(resources_of(dev_template, "AWS::SecretsManager::Secret")) == 2
 
-    def test_api_keys_secret_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_api_keys_secret_name(self, dev_template: Template) -> None:
+        find_properties(
+            dev_template,
             "AWS::SecretsManager::Secret",
-            {"Name": "realtime-agentic-api/dev/api-keys"},
+            Name="realtime-agentic-api/dev/api-keys",
         )
 
-    def test_jwt_secret_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_jwt_secret_name(self, dev_template: Template) -> None:
+        find_properties(
+            dev_template,
             "AWS::SecretsManager::Secret",
-            {"Name": "realtime-agentic-api/dev/jwt-signing-key"},
+            Name="realtime-agentic-api/dev/jwt-signing-key",
         )
 
-    def test_dev_secrets_deleted_on_removal(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource(
-            "AWS::SecretsManager::Secret",
-            {"DeletionPolicy": "Delete"},
-        )
+    def test_dev_secrets_deleted_on_removal(self, dev_template: Template) -> None:
+        find_resource(dev_template, "AWS::SecretsManager::Secret", DeletionPolicy="Delete")
 
-    def test_prod_secrets_retained(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource(
+    def test_prod_secrets_retained(self, prod_template: Template) -> None:
+        find_resource(
+            prod_template,
             "AWS::SecretsManager::Secret",
-            {
-                "DeletionPolicy": "Retain",
-                "UpdateReplacePolicy": "Retain",
-            },
+            DeletionPolicy="Retain",
+            UpdateReplacePolicy="Retain",
         )
 class TestAuthStackLambdas:
     """Tests for authorizer Lambda functions."""
 
-    def test_two_lambda_functions_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::Lambda::Function", 2)
-
-    def test_api_key_authorizer_function_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Lambda::Function",
-            {
-                "FunctionName": "realtime-agentic-api-dev-api-key-authorizer",
-                "Runtime": "python3.11",
-                "Handler": "runtime.auth.api_key_authorizer.handler",
-            },
-        )
-
-    def test_jwt_authorizer_function_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Lambda::Function",
-            {
-                "FunctionName": "realtime-agentic-api-dev-jwt-authorizer",
-                "Runtime": "python3.11",
-                "Handler": "runtime.auth.jwt_authorizer.handler",
-            },
-        )
-
-    def test_api_key_authorizer_env_vars(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Lambda::Function",
-            {
-                "FunctionName": "realtime-agentic-api-dev-api-key-authorizer",
-                "Environment": {
-                    "Variables": {
-                        "STAGE": "dev",
-                        "API_KEYS_SECRET_NAME": Match.any_value(),
-                    }
-                },
-            },
-        )
-
-    def test_jwt_authorizer_env_vars(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Lambda::Function",
-            {
-                "FunctionName": "realtime-agentic-api-dev-jwt-authorizer",
-                "Environment": {
-                    "Variables": {
-                        "STAGE": "dev",
-                        "JWT_SECRET_NAME": Match.any_value(),
-                    }
-                },
-            },
-        )
+    def test_two_lambda_functions_created(self, dev_template: Template) -> None:
+        assert len(resources_of(dev_template, "AWS::Lambda::Function")) == 2
+
+    @pytest.mark.parametrize(
+        ("function_name", "handler", "secret_env_var"),
+        [
+            (
+                "realtime-agentic-api-dev-api-key-authorizer",
+                "runtime.auth.api_key_authorizer.handler",
+                "API_KEYS_SECRET_NAME",
+            ),
+            (
+                "realtime-agentic-api-dev-jwt-authorizer",
+                "runtime.auth.jwt_authorizer.handler",
+                "JWT_SECRET_NAME",
+            ),
+        ],
+    )
+    def test_lambda_properties(
+        self, dev_template: Template, function_name: str, handler: str, secret_env_var: str
+    ) -> None:
+        props = find_properties(dev_template, "AWS::Lambda::Function", FunctionName=function_name)
+        assert props["Runtime"] == "python3.11"
+        assert props["Handler"] == handler
+        env_vars = props["Environment"]["Variables"]
+        assert env_vars["STAGE"] == "dev"
+        assert secret_env_var in env_vars
 class TestAuthStackSSMParams:
     """Tests for SSM parameters."""
 
-    def test_ssm_parameters_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::SSM::Parameter", 4)
+    def test_ssm_parameters_created(self, dev_template: Template) -> None:
+        assert len(resources_of(dev_template, "AWS::SSM::Parameter")) == 4
 class TestAuthStackOutputs:
     """Tests for stack outputs."""
 
-    def test_outputs_present(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_output(
+    def test_outputs_present(self, dev_template: Template) -> None:
+        dev_template.has_output(
             "ApiKeyAuthorizerFnArn",
             {"Description": "API Key authorizer Lambda ARN"},
         )
-        template.has_output(
+        dev_template.has_output(
             "JwtAuthorizerFnArn",
             {"Description": "JWT authorizer Lambda ARN"},
         )
-        template.has_output(
+        dev_template.has_output(
             "ApiKeysSecretArn",
             {"Description": "API keys secret ARN"},
         )
-        template.has_output(
+        dev_template.has_output(
             "JwtSecretArn",
             {"Description": "JWT signing key secret ARN"},
         )
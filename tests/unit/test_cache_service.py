@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterator
+from decimal import Decimal
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from runtime.shared.cache_service import (
     CacheConfig,
@@ -11,8 +16,16 @@ from runtime.shared.cache_service import (
     LocalLRUCache,
     create_cache_service,
 )
+from tests.unit._fake_redis import Call, FakeRedis
 
 
+@pytest.fixture(scope="module", autouse=True)
+def fake_redis_module() -> Iterator[MagicMock]:
+    """Install a stand-in ``redis`` module once for every test in this file."""
+    module = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "redis", module)
+        yield module
 class TestLocalLRUCache:
     """Tests for the LocalLRUCache class."""
 
@@ -31,14 +44,13 @@ class TestLocalLRUCache:
         assert cache.get("key1") == "value1"
 
     def test_ttl_expired_evicted(self) -> None:
-        cache = LocalLRUCache()
-        with patch("runtime.shared.cache_service.time.time") as mock_time:
-            mock_time.return_value = 1000.0
-            cache.set("key1", "value1", ttl=10)
-            assert cache.get("key1") == "value1"
-            mock_time.return_value = 1011.0
-            assert cache.get("key1") is None
-            assert cache.exists("key1") is False
+        now = [1_000 * 10**9]
+        cache = LocalLRUCache(clock=lambda: now[0])
+        cache.set("key1", "value1", ttl=10)
+        assert cache.get("key1") == "value1"
+        now[0] += 11 * 10**9
+        assert cache.get("key1") is None
+        assert cache.exists("key1") is False
 
     def test_delete_existing_key(self) -> None:
         cache = LocalLRUCache()
@@ -88,6 +100,28 @@ class TestLocalLRUCache:
         assert cache.get("key3") == "value3"
         assert cache.get("key4") == "value4"
 
+    def test_lru_eviction_large_scale(self) -> None:
+        cache = LocalLRUCache(max_size=1000)
+        # Reference LRU order: oldest first, refreshed on every hit.
+        expected: dict[str, int] = {}
+        for i in range(10_000):
+            key = f"ns{i % 10}:key{i}"
+            cache.set(key, i)
+            expected[key] = i
+            if len(expected) > 1000:
+                del expected[next(iter(expected))]
+            touched = f"ns{max(i - 500, 0) % 10}:key{max(i - 500, 0)}"
+            if cache.get(touched) is not None:
+                expected[touched] = expected.pop(touched)
+        assert cache.size() == 1000
+        assert list(cache._data) == list(expected)
+        assert cache.get("ns0:key0") is None
+        assert cache.get("ns9:key9999") == 9999
+        # Evicted keys are dropped from the prefix index as well.
+        assert cache._prefix_index == {
+            f"ns{n}:": {key for key in expected if key.startswith(f"ns{n}:")} for n in range(10)
+        }
+
     def test_update_moves_to_end(self) -> None:
         cache = LocalLRUCache(max_size=2)
         cache.set("key1", "value1")
@@ -99,6 +133,41 @@ class TestLocalLRUCache:
         assert cache.get("key2") is None
         assert cache.get("key1") == "new_value1"
         assert cache.get("key3") == "value3"
+
+    def test_delete_pattern_prefix_uses_index(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = LocalLRUCache(max_size=100_000)
+        for i in range(10_000):
+            cache.set(f"agent:{i}", i)
+        for i in range(50_000):
+            cache.set(f"task:{i}", i)
+
+        def _no_scan(name: str, pat: str) -> bool:
+            raise AssertionError("prefix invalidation must not match keys one by one")
+
+        monkeypatch.setattr("runtime.shared.cache_service.fnmatch.fnmatchcase", _no_scan)
+        assert cache.delete_pattern("agent:*") == 10_000
+        assert cache.size() == 50_000
+        assert cache.get("task:0") == 0
+        assert cache.delete_pattern("agent:*") == 0
+
+    def test_delete_pattern_non_prefix_falls_back(self) -> None:
+        cache = LocalLRUCache()
+        cache.set("agent:1:tools", 1)
+        cache.set("agent:2:state", 2)
+        cache.set("task:1:tools", 3)
+        assert cache.delete_pattern("*:tools") == 2
+        assert cache.get("agent:2:state") == 2
+        # The prefix index stays consistent after a fallback delete.
+        assert cache.delete_pattern("agent:*") == 1
+        assert cache.size() == 0
+
+    def test_delete_pattern_skips_evicted_keys(self) -> None:
+        cache = LocalLRUCache(max_size=2)
+        cache.set("agent:1", 1)
+        cache.set("agent:2", 2)
+        cache.set("task:1", 3)
+        assert cache.delete_pattern("agent:*") == 1
+        assert cache.get("task:1") == 3
 class TestCacheServiceLocalOnly:
     """Tests for CacheService in local-only mode (no Redis)."""
 
@@ -106,6 +175,13 @@ class TestCacheServiceLocalOnly:
         service = CacheService(config=None)
         assert service._use_local_only is True
 
+    def test_local_only_binds_local_operations(self) -> None:
+        service = CacheService(config=None)
+        assert service.get == service._local_cache.get
+        assert service.delete == service._local_cache.delete
+        assert service.exists == service._local_cache.exists
+        assert service.set("key1", "value1") is True
+
     def test_set_and_get_local_only(self) -> None:
         service = CacheService(config=None)
         service.set("key1", {"data": "value1"})
@@ -146,6 +222,13 @@ class TestCacheServiceLocalOnly:
         deleted = service.invalidate_pattern("agent:*")
         assert deleted == 2
         assert service.get("agent:1") is None
+
+    def test_invalidate_pattern_local_only_keeps_other_keys(self) -> None:
+        service = CacheService(config=None)
+        service.set("agent:1", "value1")
+        service.set("task:1", "value2")
+        assert service.invalidate_pattern("agent:*") == 1
+        assert service.get("task:1") == "value2"
 class TestCacheServiceCacheAside:
     """Tests for cache-aside pattern implementation."""
 
@@ -218,94 +301,109 @@ class TestCacheServiceSerialization:
         }
         service.set("key1", data)
         assert service.get("key1") == data
-class TestCacheServiceWithMockedRedis:
-    """Tests for CacheService with mocked Redis client."""
-
-    def test_connect_success(self) -> None:
-        mock_redis_module = MagicMock()
-        mock_client = MagicMock()
-        mock_redis_module.Redis.return_value = mock_client
-
-        with patch.dict("sys.modules", {"redis": mock_redis_module}):
-            config = CacheConfig(host="localhost", port=6379)
-            service = CacheService(config=config)
-
-            assert service._use_local_only is False
-            mock_client.ping.assert_called_once()
-
-    def test_get_from_redis(self) -> None:
-        mock_redis_module = MagicMock()
-        mock_client = MagicMock()
-        mock_client.get.return_value = '{"data": "value"}'
-        mock_redis_module.Redis.return_value = mock_client
-
-        with patch.dict("sys.modules", {"redis": mock_redis_module}):
-            config = CacheConfig(host="localhost", port=6379)
-            service = CacheService(config=config)
-            result = service.get("key1")
-
-            assert result == {"data": "value"}
-            mock_client.get.assert_called_once_with("key1")
-
-    def test_set_to_redis_with_ttl(self) -> None:
-        mock_redis_module = MagicMock()
-        mock_client = MagicMock()
-        mock_redis_module.Redis.return_value = mock_client
-
-        with patch.dict("sys.modules", {"redis": mock_redis_module}):
-            config = CacheConfig(host="localhost", port=6379)
-            service = CacheService(config=config)
-            service.set("key1", {"data": "value"}, ttl=300)
-
-            mock_client.setex.assert_called_once()
-            call_args = mock_client.setex.call_args
-            assert call_args[0][0] == "key1"
-            assert call_args[0][1] == 300
-
-    def test_set_to_redis_without_ttl(self) -> None:
-        mock_redis_module = MagicMock()
-        mock_client = MagicMock()
-        mock_redis_module.Redis.return_value = mock_client
-
-        with patch.dict("sys.modules", {"redis": mock_redis_module}):
-            config = CacheConfig(host="localhost", port=6379)
-            service = CacheService(config=config)
-            service.set("key1", "value1")
 
-            mock_client.set.assert_called_once()
-
-    def test_invalidate_pattern_uses_scan(self) -> None:
-        mock_redis_module = MagicMock()
-        mock_client = MagicMock()
-        mock_client.scan.side_effect = [(1, ["a", "b"]), (0, ["c"])]
-        mock_client.delete.side_effect = [2, 1]
-        mock_redis_module.Redis.return_value = mock_client
+    def test_serialize_returns_bytes(self) -> None:
+        service = CacheService(config=None)
+        assert service._serialize({"a": 1}) == b'{"a":1}'
 
-        with patch.dict("sys.modules", {"redis": mock_redis_module}):
-            config = CacheConfig(host="localhost", port=6379)
-            service = CacheService(config=config)
-            service._local_cache.set("a", 1)
-            service._local_cache.set("b", 2)
-            service._local_cache.set("c", 3)
+    @pytest.mark.parametrize("raw", [b'{"a":[1,2]}', '{"a":[1,2]}'], ids=["bytes", "str"])
+    def test_deserialize_bytes_or_str(self, raw: str | bytes) -> None:
+        service = CacheService(config=None)
+        assert service._deserialize(raw) == {"a": [1, 2]}
 
-            deleted = service.invalidate_pattern("a*")
+    def test_serialize_non_str_keys_and_fallback(self) -> None:
+        service = CacheService(config=None)
+        data = {1: "one", "price": Decimal("1.50")}
+        assert service._deserialize(service._serialize(data)) == {"1": "one", "price": "1.50"}
+@pytest.fixture()
+def mocked_redis_service(fake_redis_module: MagicMock) -> tuple[CacheService, FakeRedis]:
+    """Return a Redis-backed CacheService and its in-memory fake client."""
+    fake = FakeRedis()
+    fake_redis_module.Redis.return_value = fake
+    service = CacheService(config=CacheConfig(host="localhost", port=6379))
+    return service, fake
+class TestCacheServiceWithMockedRedis:
+    """Tests for CacheService with a fake Redis client."""
+
+    def test_connect_success(self, mocked_redis_service: tuple[CacheService, FakeRedis]) -> None:
+        service, fake = mocked_redis_service
+        assert service._use_local_only is False
+        assert fake.calls == [("ping", (), {})]
+
+    @pytest.mark.parametrize(
+        ("method", "args", "stored", "expected"),
+        [
+            ("get", ("key1",), {"key1": '{"data": "value"}'}, {"data": "value"}),
+            ("get", ("missing",), {}, None),
+            ("delete", ("key1",), {"key1": "1"}, True),
+            ("exists", ("key1",), {"key1": "1"}, True),
+        ],
+    )
+    def test_reads_through_to_redis(
+        self,
+        mocked_redis_service: tuple[CacheService, FakeRedis],
+        method: str,
+        args: tuple[Any, ...],
+        stored: dict[str, Any],
+        expected: Any,
+    ) -> None:
+        service, fake = mocked_redis_service
+        fake.store.update(stored)
+
+        assert getattr(service, method)(*args) == expected
+        assert fake.calls[-1] == (method, args, {})
+
+    @pytest.mark.parametrize(
+        ("ttl", "expected_call"),
+        [
+            (300, ("setex", ("key1", 300, b'{"data":"value"}'), {})),
+            (None, ("set", ("key1", b'{"data":"value"}'), {})),
+        ],
+    )
+    def test_set_to_redis(
+        self,
+        mocked_redis_service: tuple[CacheService, FakeRedis],
+        ttl: int | None,
+        expected_call: Call,
+    ) -> None:
+        service, fake = mocked_redis_service
+        service.set("key1", {"data": "value"}, ttl=ttl)
+
+        assert fake.calls[-1] == expected_call
+
+    def test_invalidate_pattern_uses_scan(
+        self, mocked_redis_service: tuple[CacheService, FakeRedis]
+    ) -> None:
+        service, fake = mocked_redis_service
+        fake.store.update({"a1": "1", "a2": "2", "b1": "3"})
+        service._local_cache.set("a1", 1)
+        service._local_cache.set("a2", 2)
+
+        deleted = service.invalidate_pattern("a*")
 
-        assert deleted == 3
+        assert deleted == 2
+        assert fake.calls[1] == ("scan", (), {"cursor": 0, "match": "a*", "count": 100})
+        assert fake.calls[2] == ("pipeline", (), {"transaction": False})
+        assert fake.pipelines[0].calls == [("delete", ("a1", "a2"), {})]
+        assert fake.store == {"b1": "3"}
         assert service._local_cache.size() == 0
 
-    def test_delete_from_redis(self) -> None:
-        mock_redis_module = MagicMock()
-        mock_client = MagicMock()
-        mock_client.delete.return_value = 1
-        mock_redis_module.Redis.return_value = mock_client
+    def test_invalidate_pattern_chunks_pipeline_deletes(
+        self, mocked_redis_service: tuple[CacheService, FakeRedis]
+    ) -> None:
+        service, fake = mocked_redis_service
+        fake.store.update({f"agent:{i}": str(i) for i in range(2500)})
 
-        with patch.dict("sys.modules", {"redis": mock_redis_module}):
-            config = CacheConfig(host="localhost", port=6379)
-            service = CacheService(config=config)
-            result = service.delete("key1")
+        assert service.invalidate_pattern("agent:*") == 2500
+        assert [len(args) for _, args, _ in fake.pipelines[0].calls] == [1000, 1000, 500]
 
-            assert result is True
-            mock_client.delete.assert_called_once_with("key1")
+    def test_invalidate_pattern_no_matches_skips_pipeline(
+        self, mocked_redis_service: tuple[CacheService, FakeRedis]
+    ) -> None:
+        service, fake = mocked_redis_service
+
+        assert service.invalidate_pattern("agent:*") == 0
+        assert fake.pipelines == []
 class TestCreateCacheService:
     """Tests for the create_cache_service factory function."""
 
@@ -314,15 +412,10 @@ class TestCreateCacheService:
         assert service._use_local_only is True
 
     def test_create_with_host(self) -> None:
-        mock_redis_module = MagicMock()
-        mock_client = MagicMock()
-        mock_redis_module.Redis.return_value = mock_client
-
-        with patch.dict("sys.modules", {"redis": mock_redis_module}):
-            service = create_cache_service(host="localhost", port=6379)
-            assert service.config is not None
-            assert service.config.host == "localhost"
-            assert service.config.port == 6379
+        service = create_cache_service(host="localhost", port=6379)
+        assert service.config is not None
+        assert service.config.host == "localhost"
+        assert service.config.port == 6379
 class TestCacheServiceContextManager:
     """Tests for context manager functionality."""
 
@@ -331,14 +424,9 @@ class TestCacheServiceContextManager:
             service.set("key1", "value1")
             assert service.get("key1") == "value1"
 
-    def test_close_calls_redis_close(self) -> None:
-        mock_redis_module = MagicMock()
-        mock_client = MagicMock()
-        mock_redis_module.Redis.return_value = mock_client
-
-        with patch.dict("sys.modules", {"redis": mock_redis_module}):
-            config = CacheConfig(host="localhost", port=6379)
-            service = CacheService(config=config)
-            service.close()
-
-            mock_client.close.assert_called_once()
+    def test_close_calls_redis_close(
+        self, mocked_redis_service: tuple[CacheService, FakeRedis]
+    ) -> None:
+        service, fake = mocked_redis_service
+        service.close()
+        assert fake.calls[-1] == ("close", (), {})
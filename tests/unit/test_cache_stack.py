@@ -1,163 +1,108 @@
 """Unit tests for the Cache CDK stack."""
 
+from collections.abc import Callable
+from dataclasses import replace
+
 import aws_cdk as cdk
+import pytest
 from aws_cdk.assertions import Template
 
 from infra.cache_stack import CacheStack
 from infra.config import EnvironmentConfig
 from infra.foundation_stack import FoundationStack
+from tests.unit._template_index import find_properties, find_resource, resources_of
+
+pytestmark = pytest.mark.usefixtures("cdk_warmup")
+
+
+@pytest.fixture(scope="module")
+def build_stack() -> Callable[..., cdk.Stack]:
+    def build(app: cdk.App, config: EnvironmentConfig, env: cdk.Environment) -> cdk.Stack:
+        stage = config.stage.capitalize()
+        foundation = FoundationStack(app, f"TestFoundation{stage}", config=config, env=env)
+        return CacheStack(
+            app,
+            f"TestCache{stage}",
+            config=config,
+            vpc=foundation.vpc,
+            cache_security_group=foundation.cache_sg,
+            env=env,
+        )
 
-
-def _synth_template(config: EnvironmentConfig) -> Template:
-    app = cdk.App()
-    env = cdk.Environment(account=config.aws_account_id, region=config.aws_region)
-
-    foundation = FoundationStack(
-        app,
-        "TestFoundation",
-        config=config,
-        env=env,
-    )
-
-    cache_stack = CacheStack(
-        app,
-        "TestCache",
-        config=config,
-        vpc=foundation.vpc,
-        cache_security_group=foundation.cache_sg,
-        env=env,
-    )
-
-    return Template.from_stack(cache_stack)
-def _dev_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="dev",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        nat_gateways=0,
-        tags={"Environment": "dev"},
-    )
-def _prod_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="prod",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        max_azs=3,
-        nat_gateways=2,
-        cache_node_type="cache.t3.small",
-        tags={"Environment": "prod"},
-    )
+    return build
+@pytest.fixture(scope="module")
+def stack_configs(stack_configs: tuple[EnvironmentConfig, ...]) -> tuple[EnvironmentConfig, ...]:
+    dev, prod = stack_configs
+    return (dev, replace(prod, cache_node_type="cache.t3.small"))
 class TestCacheStackCluster:
     """Tests that ElastiCache Redis cluster is created correctly."""
 
-    def test_redis_cluster_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::ElastiCache::CacheCluster", 1)
-
-    def test_redis_engine(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::ElastiCache::CacheCluster",
-            {"Engine": "redis"},
-        )
-
-    def test_redis_version(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::ElastiCache::CacheCluster",
-            {"EngineVersion": "7.1"},
-        )
-
-    def test_dev_node_type(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::ElastiCache::CacheCluster",
-            {"CacheNodeType": "cache.t3.micro"},
-        )
-
-    def test_prod_node_type(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource_properties(
-            "AWS::ElastiCache::CacheCluster",
-            {"CacheNodeType": "cache.t3.small"},
-        )
+    def test_redis_cluster_created(self, dev_template: Template) -> None:
+        assert len(resources_of(dev_template, "AWS::ElastiCache::CacheCluster")) == 1
 
-    def test_single_node(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_dev_cluster_properties(self, dev_template: Template) -> None:
+        find_properties(
+            dev_template,
             "AWS::ElastiCache::CacheCluster",
-            {"NumCacheNodes": 1},
+            Engine="redis",
+            EngineVersion="7.1",
+            CacheNodeType="cache.t3.micro",
+            NumCacheNodes=1,
+            Port=6379,
         )
 
-    def test_redis_port(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::ElastiCache::CacheCluster",
-            {"Port": 6379},
+    def test_prod_node_type(self, prod_template: Template) -> None:
+        find_properties(
+            prod_template, "AWS::ElastiCache::CacheCluster", CacheNodeType="cache.t3.small"
         )
 class TestCacheStackSubnetGroup:
     """Tests for ElastiCache subnet group."""
 
-    def test_subnet_group_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::ElastiCache::SubnetGroup", 1)
+    def test_subnet_group_created(self, dev_template: Template) -> None:
+        assert len(resources_of(dev_template, "AWS::ElastiCache::SubnetGroup")) == 1
 
-    def test_subnet_group_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_subnet_group_name(self, dev_template: Template) -> None:
+        find_properties(
+            dev_template,
             "AWS::ElastiCache::SubnetGroup",
-            {"CacheSubnetGroupName": "realtime-agentic-api-dev-cache-subnet-group"},
+            CacheSubnetGroupName="realtime-agentic-api-dev-cache-subnet-group",
         )
 class TestCacheStackSnapshots:
     """Tests for snapshot configuration."""
 
-    def test_dev_no_snapshots(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::ElastiCache::CacheCluster",
-            {"SnapshotRetentionLimit": 0},
-        )
+    def test_dev_no_snapshots(self, dev_template: Template) -> None:
+        find_properties(dev_template, "AWS::ElastiCache::CacheCluster", SnapshotRetentionLimit=0)
 
-    def test_prod_snapshots_enabled(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource_properties(
-            "AWS::ElastiCache::CacheCluster",
-            {"SnapshotRetentionLimit": 7},
-        )
+    def test_prod_snapshots_enabled(self, prod_template: Template) -> None:
+        find_properties(prod_template, "AWS::ElastiCache::CacheCluster", SnapshotRetentionLimit=7)
 class TestCacheStackRemovalPolicy:
     """Tests for removal policy configuration."""
 
-    def test_dev_cluster_deleted_on_stack_removal(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource(
+    def test_dev_cluster_deleted_on_stack_removal(self, dev_template: Template) -> None:
+        find_resource(
+            dev_template,
             "AWS::ElastiCache::CacheCluster",
-            {
-                "DeletionPolicy": "Delete",
-                "UpdateReplacePolicy": "Delete",
-            },
+            DeletionPolicy="Delete",
+            UpdateReplacePolicy="Delete",
         )
 
-    def test_prod_cluster_retained(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource(
+    def test_prod_cluster_retained(self, prod_template: Template) -> None:
+        find_resource(
+            prod_template,
             "AWS::ElastiCache::CacheCluster",
-            {
-                "DeletionPolicy": "Retain",
-                "UpdateReplacePolicy": "Retain",
-            },
+            DeletionPolicy="Retain",
+            UpdateReplacePolicy="Retain",
         )
 class TestCacheStackSSMParams:
     """Tests for SSM parameter publishing."""
 
-    def test_ssm_parameters_created(self) -> None:
-        template = _synth_template(_dev_config())
+    def test_ssm_parameters_created(self, dev_template: Template) -> None:
         # 2 parameters: endpoint and port
-        template.resource_count_is("AWS::SSM::Parameter", 2)
+        assert len(resources_of(dev_template, "AWS::SSM::Parameter")) == 2
 class TestCacheStackOutputs:
     """Tests for stack outputs."""
 
-    def test_outputs_present(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_output("CacheClusterEndpoint", {})
-        template.has_output("CacheClusterPort", {})
-        template.has_output("CacheClusterName", {})
+    def test_outputs_present(self, dev_template: Template) -> None:
+        dev_template.has_output("CacheClusterEndpoint", {})
+        dev_template.has_output("CacheClusterPort", {})
+        dev_template.has_output("CacheClusterName", {})
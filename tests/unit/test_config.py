@@ -24,6 +24,18 @@ class TestEnvironmentConfig:
         )
         with pytest.raises(AttributeError):
             config.stage = "prod"  # type: ignore[misc]
+
+    def test_hashable(self) -> None:
+        tags = (("Environment", "dev"),)
+        a = EnvironmentConfig(
+            stage="dev", aws_account_id="123456789012", aws_region="us-east-1", tags=tags
+        )
+        b = EnvironmentConfig(
+            stage="dev", aws_account_id="123456789012", aws_region="us-east-1", tags=tags
+        )
+        assert a == b
+        assert hash(a) == hash(b)
+        assert not hasattr(a, "__dict__")
 class TestGetEnvironmentConfig:
     def test_dev(self) -> None:
         config = get_environment_config("dev")
@@ -40,6 +52,7 @@ class TestGetEnvironmentConfig:
         assert config.stage == "prod"
         assert config.nat_gateways == 2
         assert config.max_azs == 3
+        assert config.task_provisioned_concurrency == 2
 
     def test_unknown_env_raises(self) -> None:
         with pytest.raises(ValueError, match="Unknown environment"):
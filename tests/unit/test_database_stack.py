@@ -1,78 +1,58 @@
 """Unit tests for the Database CDK stack."""
 
+from collections.abc import Callable
+
 import aws_cdk as cdk
+import pytest
 from aws_cdk.assertions import Match, Template
 
 from infra.config import EnvironmentConfig
 from infra.database_stack import DatabaseStack
 
+pytestmark = pytest.mark.usefixtures("cdk_warmup")
+
+
+@pytest.fixture(scope="module")
+def build_stack() -> Callable[..., cdk.Stack]:
+    def build(app: cdk.App, config: EnvironmentConfig, env: cdk.Environment) -> cdk.Stack:
+        stack_id = f"TestDatabase{config.stage.capitalize()}"
+        return DatabaseStack(app, stack_id, config=config, env=env)
 
-def _synth_template(config: EnvironmentConfig) -> Template:
-    app = cdk.App()
-    stack = DatabaseStack(
-        app,
-        "TestDatabase",
-        config=config,
-        env=cdk.Environment(account=config.aws_account_id, region=config.aws_region),
-    )
-    return Template.from_stack(stack)
-def _dev_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="dev",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        nat_gateways=0,
-        tags={"Environment": "dev"},
-    )
-def _prod_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="prod",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        max_azs=3,
-        nat_gateways=2,
-        tags={"Environment": "prod"},
-    )
+    return build
 class TestDatabaseStackTables:
     """Tests that all four DynamoDB tables are created."""
 
-    def test_four_tables_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::DynamoDB::Table", 4)
+    def test_four_tables_created(self, dev_template: Template) -> None:
+        dev_template.resource_count_is("AWS::DynamoDB::Table", 4)
 
-    def test_agents_table_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_agents_table_name(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {"TableName": "realtime-agentic-api-dev-agents"},
         )
 
-    def test_tasks_table_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_tasks_table_name(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {"TableName": "realtime-agentic-api-dev-tasks"},
         )
 
-    def test_context_table_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_context_table_name(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {"TableName": "realtime-agentic-api-dev-context"},
         )
 
-    def test_connections_table_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_connections_table_name(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {"TableName": "realtime-agentic-api-dev-connections"},
         )
 class TestDatabaseStackKeySchema:
     """Tests for partition and sort key configuration."""
 
-    def test_agents_table_key_schema(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_agents_table_key_schema(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-agents",
@@ -83,9 +63,8 @@ class TestDatabaseStackKeySchema:
             },
         )
 
-    def test_tasks_table_key_schema(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_tasks_table_key_schema(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-tasks",
@@ -96,9 +75,8 @@ class TestDatabaseStackKeySchema:
             },
         )
 
-    def test_context_table_key_schema(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_context_table_key_schema(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-context",
@@ -109,9 +87,8 @@ class TestDatabaseStackKeySchema:
             },
         )
 
-    def test_connections_table_key_schema(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_connections_table_key_schema(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-connections",
@@ -124,9 +101,8 @@ class TestDatabaseStackKeySchema:
 class TestDatabaseStackGSIs:
     """Tests for Global Secondary Indexes."""
 
-    def test_agents_table_has_user_agents_gsi(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_agents_table_has_user_agents_gsi(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-agents",
@@ -147,9 +123,8 @@ class TestDatabaseStackGSIs:
             },
         )
 
-    def test_tasks_table_has_task_status_gsi(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_tasks_table_has_task_status_gsi(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-tasks",
@@ -172,9 +147,8 @@ class TestDatabaseStackGSIs:
 class TestDatabaseStackTTL:
     """Tests for TTL configuration."""
 
-    def test_context_table_has_ttl(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_context_table_has_ttl(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-context",
@@ -185,9 +159,8 @@ class TestDatabaseStackTTL:
             },
         )
 
-    def test_connections_table_has_ttl(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_connections_table_has_ttl(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-connections",
@@ -200,9 +173,8 @@ class TestDatabaseStackTTL:
 class TestDatabaseStackBilling:
     """Tests for billing mode configuration."""
 
-    def test_pay_per_request_billing(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_pay_per_request_billing(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-dev-agents",
@@ -212,9 +184,8 @@ class TestDatabaseStackBilling:
 class TestDatabaseStackDevRemovalPolicy:
     """Tests that dev tables use DESTROY removal policy."""
 
-    def test_dev_tables_deleted_on_stack_removal(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource(
+    def test_dev_tables_deleted_on_stack_removal(self, dev_template: Template) -> None:
+        dev_template.has_resource(
             "AWS::DynamoDB::Table",
             {
                 "DeletionPolicy": "Delete",
@@ -224,9 +195,8 @@ class TestDatabaseStackDevRemovalPolicy:
 class TestDatabaseStackProd:
     """Tests for production-specific configuration."""
 
-    def test_prod_tables_retained(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource(
+    def test_prod_tables_retained(self, prod_template: Template) -> None:
+        prod_template.has_resource(
             "AWS::DynamoDB::Table",
             {
                 "DeletionPolicy": "Retain",
@@ -234,9 +204,8 @@ class TestDatabaseStackProd:
             },
         )
 
-    def test_prod_pitr_enabled(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource_properties(
+    def test_prod_pitr_enabled(self, prod_template: Template) -> None:
+        prod_template.has_resource_properties(
             "AWS::DynamoDB::Table",
             {
                 "TableName": "realtime-agentic-api-prod-agents",
@@ -246,16 +215,14 @@ class TestDatabaseStackProd:
 class TestDatabaseStackSSMParams:
     """Tests for SSM parameter publishing."""
 
-    def test_ssm_parameters_created(self) -> None:
-        template = _synth_template(_dev_config())
+    def test_ssm_parameters_created(self, dev_template: Template) -> None:
         # 4 table names + 4 table ARNs = 8
-        template.resource_count_is("AWS::SSM::Parameter", 8)
+        dev_template.resource_count_is("AWS::SSM::Parameter", 8)
 class TestDatabaseStackOutputs:
     """Tests for stack outputs."""
 
-    def test_outputs_present(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_output("AgentsTableName", {})
-        template.has_output("TasksTableName", {})
-        template.has_output("ContextTableName", {})
-        template.has_output("ConnectionsTableName", {})
+    def test_outputs_present(self, dev_template: Template) -> None:
+        dev_template.has_output("AgentsTableName", {})
+        dev_template.has_output("TasksTableName", {})
+        dev_template.has_output("ContextTableName", {})
+        dev_template.has_output("ConnectionsTableName", {})
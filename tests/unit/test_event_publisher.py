@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -11,18 +12,21 @@ import pytest
 from runtime.shared.config import RuntimeConfig
 from runtime.shared.event_publisher import EventPublisher, EventValidationError
 
-
-def _config() -> RuntimeConfig:
-    return RuntimeConfig(
-        stage="dev",
-        aws_region="us-east-1",
-        agents_table="agents",
-        tasks_table="tasks",
-        context_table="context",
-        connections_table="connections",
-        event_bus_name="test-events",
-        secrets_prefix="test",
-    )
+_CONFIG = RuntimeConfig(
+    stage="dev",
+    aws_region="us-east-1",
+    agents_table="agents",
+    tasks_table="tasks",
+    context_table="context",
+    connections_table="connections",
+    event_bus_name="test-events",
+    secrets_prefix="test",
+)
+@pytest.fixture(scope="module", autouse=True)
+def _patch_boto3() -> Iterator[MagicMock]:
+    """Patch boto3 once for the module; each test injects its own client."""
+    with patch("runtime.shared.event_publisher.boto3") as mock_boto:
+        yield mock_boto
 def _mock_client() -> MagicMock:
     """Return a mock boto3 events client with a successful put_events response."""
     client = MagicMock()
@@ -32,10 +36,9 @@ def _mock_client() -> MagicMock:
     }
     return client
 def _publisher(client: MagicMock) -> EventPublisher:
-    """Create an EventPublisher with a pre-configured mock client."""
-    with patch("runtime.shared.event_publisher.boto3") as mock_boto:
-        mock_boto.client.return_value = client
-        pub = EventPublisher(_config())
+    """Create an EventPublisher that sends through *client*."""
+    pub = EventPublisher(_CONFIG)
+    pub._client = client
     return pub
 def _last_put_entry(client: MagicMock) -> dict[str, Any]:
     """Extract the single entry from the most recent put_events call."""
@@ -185,6 +188,76 @@ class TestEventPublisherTaskProgress:
         pub.publish_task_progress("t", "a", 100)
         detail = json.loads(_last_put_entry(client)["Detail"])
         assert detail["progressPct"] == 100
+class TestEventPublisherQueue:
+    """Tests for queue_task_progress and flush."""
+
+    def test_flush_sends_queued_events_together(self) -> None:
+        client = _mock_client()
+        client.put_events.return_value = {
+            "FailedEntryCount": 0,
+            "Entries": [{"EventId": "id-1"}, {"EventId": "id-2"}],
+        }
+        pub = _publisher(client)
+
+        pub.queue_task_progress("t", "a", 50)
+        pub.queue_task_progress("t", "a", 100, message="done")
+        client.put_events.assert_not_called()
+
+        assert pub.flush() == ["id-1", "id-2"]
+        entries = client.put_events.call_args[1]["Entries"]
+        assert [json.loads(e["Detail"])["progressPct"] for e in entries] == [50, 100]
+        assert pub.flush() == []
+        client.put_events.assert_called_once()
+
+    def test_flush_chunks_by_ten(self) -> None:
+        client = _mock_client()
+        client.put_events.side_effect = lambda Entries: {
+            "FailedEntryCount": 0,
+            "Entries": [{"EventId": f"id-{i}"} for i in range(len(Entries))],
+        }
+        pub = _publisher(client)
+        for pct in range(23):
+            pub.queue_task_progress("t", "a", pct)
+
+        assert len(pub.flush()) == 23
+        sizes = [len(c[1]["Entries"]) for c in client.put_events.call_args_list]
+        assert sizes == [10, 10, 3]
+
+    def test_queue_validates_eagerly(self) -> None:
+        pub = _publisher(_mock_client())
+        with pytest.raises(EventValidationError, match="progress_pct"):
+            pub.queue_task_progress("t", "a", 101)
+
+    def test_flush_failed_entry_raises(self) -> None:
+        client = _mock_client()
+        client.put_events.return_value = {
+            "FailedEntryCount": 1,
+            "Entries": [
+                {"EventId": "id-1"},
+                {"ErrorCode": "InternalError", "ErrorMessage": "Boom"},
+            ],
+        }
+        pub = _publisher(client)
+        pub.queue_task_progress("t", "a", 50)
+        pub.queue_task_progress("t", "a", 100)
+
+        with pytest.raises(RuntimeError, match="TaskProgress: InternalError"):
+            pub.flush()
+
+    def test_flush_sends_remaining_chunks_after_failure(self) -> None:
+        client = _mock_client()
+        client.put_events.side_effect = [
+            RuntimeError("throttled"),
+            {"FailedEntryCount": 0, "Entries": [{"EventId": "id-10"}]},
+        ]
+        pub = _publisher(client)
+        for pct in range(11):
+            pub.queue_task_progress("t", "a", pct)
+
+        with pytest.raises(RuntimeError, match="throttled"):
+            pub.flush()
+        assert client.put_events.call_count == 2
+        assert pub.flush() == []
 class TestEventPublisherStatusChanged:
     """Tests for publish_status_changed."""
 
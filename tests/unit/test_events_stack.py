@@ -1,167 +1,123 @@
 """Unit tests for the Events CDK stack."""
 
+from collections.abc import Callable
+from typing import Any, Final
+
 import aws_cdk as cdk
+import pytest
 from aws_cdk.assertions import Template
 
 from infra.config import EnvironmentConfig
 from infra.events_stack import EventsStack
 
-
-def _synth_template(config: EnvironmentConfig) -> Template:
-    app = cdk.App()
-    stack = EventsStack(
-        app,
-        "TestEvents",
-        config=config,
-        env=cdk.Environment(account=config.aws_account_id, region=config.aws_region),
-    )
-    return Template.from_stack(stack)
-def _dev_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="dev",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        nat_gateways=0,
-        tags={"Environment": "dev"},
-    )
-def _prod_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="prod",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        max_azs=3,
-        nat_gateways=2,
-        tags={"Environment": "prod"},
-    )
+pytestmark = pytest.mark.usefixtures("cdk_warmup")
+
+
+@pytest.fixture(scope="module")
+def build_stack() -> Callable[..., cdk.Stack]:
+    def build(app: cdk.App, config: EnvironmentConfig, env: cdk.Environment) -> cdk.Stack:
+        stack_id = f"TestEvents{config.stage.capitalize()}"
+        return EventsStack(app, stack_id, config=config, env=env)
+
+    return build
+# Expected properties of each EventBridge rule, built once at import.
+_RULE_PROPERTIES: Final = (
+    {
+        "Name": "realtime-agentic-api-dev-agent-events",
+        "EventPattern": {
+            "source": ["realtime-agentic-api.agents"],
+            "detail-type": ["AgentCreated", "AgentDeleted"],
+        },
+    },
+    {
+        "Name": "realtime-agentic-api-dev-task-events",
+        "EventPattern": {
+            "source": ["realtime-agentic-api.tasks"],
+            "detail-type": ["TaskCreated", "TaskCompleted", "TaskProgress"],
+        },
+    },
+    {
+        "Name": "realtime-agentic-api-dev-status-events",
+        "EventPattern": {
+            "source": ["realtime-agentic-api.status"],
+            "detail-type": ["AgentStatusChanged"],
+        },
+    },
+    {
+        "Name": "realtime-agentic-api-dev-error-events",
+        "EventPattern": {
+            "source": ["realtime-agentic-api.errors"],
+            "detail-type": ["ErrorOccurred"],
+        },
+    },
+    {
+        "Name": "realtime-agentic-api-dev-scheduler-events",
+        "EventPattern": {
+            "source": ["realtime-agentic-api.scheduler"],
+            "detail-type": ["ScheduledTask"],
+        },
+    },
+)
 class TestEventsStackBus:
     """Tests for the EventBridge bus creation."""
 
-    def test_event_bus_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::Events::EventBus", 1)
+    def test_event_bus_created(self, dev_template: Template) -> None:
+        dev_template.resource_count_is("AWS::Events::EventBus", 1)
 
-    def test_event_bus_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_event_bus_name(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::Events::EventBus",
             {"Name": "realtime-agentic-api-dev-events"},
         )
 
-    def test_prod_event_bus_name(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource_properties(
+    def test_prod_event_bus_name(self, prod_template: Template) -> None:
+        prod_template.has_resource_properties(
             "AWS::Events::EventBus",
             {"Name": "realtime-agentic-api-prod-events"},
         )
 class TestEventsStackArchive:
     """Tests for event archive configuration."""
 
-    def test_archive_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::Events::Archive", 1)
+    def test_archive_created(self, dev_template: Template) -> None:
+        dev_template.resource_count_is("AWS::Events::Archive", 1)
 
-    def test_archive_name(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_archive_name(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::Events::Archive",
             {"ArchiveName": "realtime-agentic-api-dev-event-archive"},
         )
 
-    def test_dev_archive_retention_7_days(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_dev_archive_retention_7_days(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::Events::Archive",
             {"RetentionDays": 7},
         )
 
-    def test_prod_archive_retention_30_days(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource_properties(
+    def test_prod_archive_retention_30_days(self, prod_template: Template) -> None:
+        prod_template.has_resource_properties(
             "AWS::Events::Archive",
             {"RetentionDays": 30},
         )
 class TestEventsStackRules:
     """Tests for event rules."""
 
-    def test_five_rules_created(self) -> None:
-        template = _synth_template(_dev_config())
-        template.resource_count_is("AWS::Events::Rule", 5)
-
-    def test_agent_events_rule(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Events::Rule",
-            {
-                "Name": "realtime-agentic-api-dev-agent-events",
-                "EventPattern": {
-                    "source": ["realtime-agentic-api.agents"],
-                    "detail-type": ["AgentCreated", "AgentDeleted"],
-                },
-            },
-        )
-
-    def test_task_events_rule(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Events::Rule",
-            {
-                "Name": "realtime-agentic-api-dev-task-events",
-                "EventPattern": {
-                    "source": ["realtime-agentic-api.tasks"],
-                    "detail-type": ["TaskCreated", "TaskCompleted", "TaskProgress"],
-                },
-            },
-        )
+    def test_five_rules_created(self, dev_template: Template) -> None:
+        dev_template.resource_count_is("AWS::Events::Rule", 5)
 
-    def test_status_events_rule(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Events::Rule",
-            {
-                "Name": "realtime-agentic-api-dev-status-events",
-                "EventPattern": {
-                    "source": ["realtime-agentic-api.status"],
-                    "detail-type": ["AgentStatusChanged"],
-                },
-            },
-        )
-
-    def test_error_events_rule(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Events::Rule",
-            {
-                "Name": "realtime-agentic-api-dev-error-events",
-                "EventPattern": {
-                    "source": ["realtime-agentic-api.errors"],
-                    "detail-type": ["ErrorOccurred"],
-                },
-            },
-        )
-
-    def test_scheduler_events_rule(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
-            "AWS::Events::Rule",
-            {
-                "Name": "realtime-agentic-api-dev-scheduler-events",
-                "EventPattern": {
-                    "source": ["realtime-agentic-api.scheduler"],
-                    "detail-type": ["ScheduledTask"],
-                },
-            },
-        )
+    @pytest.mark.parametrize(
+        "properties", _RULE_PROPERTIES, ids=["agent", "task", "status", "error", "scheduler"]
+    )
+    def test_event_rule(self, dev_template: Template, properties: dict[str, Any]) -> None:
+        dev_template.has_resource_properties("AWS::Events::Rule", properties)
 class TestEventsStackSSMParams:
     """Tests for SSM parameter publishing."""
 
-    def test_ssm_parameters_created(self) -> None:
-        template = _synth_template(_dev_config())
+    def test_ssm_parameters_created(self, dev_template: Template) -> None:
         # event bus name + event bus ARN = 2
-        template.resource_count_is("AWS::SSM::Parameter", 2)
+        dev_template.resource_count_is("AWS::SSM::Parameter", 2)
 
-    def test_event_bus_name_param(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_event_bus_name_param(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::SSM::Parameter",
             {
                 "Name": "/realtime-agentic-api-dev/event-bus-name",
@@ -169,9 +125,8 @@ class TestEventsStackSSMParams:
             },
         )
 
-    def test_event_bus_arn_param(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_resource_properties(
+    def test_event_bus_arn_param(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::SSM::Parameter",
             {
                 "Name": "/realtime-agentic-api-dev/event-bus-arn",
@@ -181,7 +136,6 @@ class TestEventsStackSSMParams:
 class TestEventsStackOutputs:
     """Tests for stack outputs."""
 
-    def test_outputs_present(self) -> None:
-        template = _synth_template(_dev_config())
-        template.has_output("EventBusName", {})
-        template.has_output("EventBusArn", {})
+    def test_outputs_present(self, dev_template: Template) -> None:
+        dev_template.has_output("EventBusName", {})
+        dev_template.has_output("EventBusArn", {})
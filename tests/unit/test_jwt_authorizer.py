@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import os
-import time
+import hashlib
+import hmac
+from collections.abc import Iterator
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from runtime.auth.jwt_authorizer import (
+    _b64url_decode,
+    _keyed_hmac,
     create_jwt,
     decode_jwt,
     extract_user_identity,
@@ -16,25 +21,36 @@ from runtime.auth.jwt_authorizer import (
 
 _METHOD_ARN = "arn:aws:execute-api:us-east-1:123456789012:abc123/dev/GET/agents"
 _SIGNING_KEY = "test-secret-key-for-unit-tests"
+# Base64url of {"sub":"hacker","role":"admin"}, unpadded.
+_TAMPERED_PAYLOAD_SEGMENT = "eyJzdWIiOiJoYWNrZXIiLCJyb2xlIjoiYWRtaW4ifQ"
+# Expiry checks see this fixed instant (via _frozen_clock), so every token
+# is a pure function of its payload and can be signed once per module.
+_NOW = 1_700_000_000.0
+@pytest.fixture(autouse=True)
+def _frozen_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("runtime.auth.jwt_authorizer.time.time", lambda: _NOW)
+@pytest.fixture(scope="module")
+def user_token() -> str:
+    return create_jwt({"sub": "user-1", "role": "user", "exp": _NOW + 3600}, _SIGNING_KEY)
+@pytest.fixture(scope="module")
+def admin_token() -> str:
+    return create_jwt({"sub": "user-2", "role": "admin", "exp": _NOW + 3600}, _SIGNING_KEY)
+@pytest.fixture(scope="module")
+def expired_token() -> str:
+    return create_jwt({"sub": "user-1", "exp": _NOW - 100}, _SIGNING_KEY)
 class TestDecodeJwt:
-    def test_valid_token(self) -> None:
-        payload = {"sub": "user-1", "role": "admin", "exp": time.time() + 3600}
-        token = create_jwt(payload, _SIGNING_KEY)
-        claims = decode_jwt(token, _SIGNING_KEY)
+    def test_valid_token(self, admin_token: str) -> None:
+        claims = decode_jwt(admin_token, _SIGNING_KEY)
         assert claims is not None
-        assert claims["sub"] == "user-1"
+        assert claims["sub"] == "user-2"
         assert claims["role"] == "admin"
 
-    def test_expired_token(self) -> None:
-        payload = {"sub": "user-1", "exp": time.time() - 100}
-        token = create_jwt(payload, _SIGNING_KEY)
-        claims = decode_jwt(token, _SIGNING_KEY)
+    def test_expired_token(self, expired_token: str) -> None:
+        claims = decode_jwt(expired_token, _SIGNING_KEY)
         assert claims is None
 
-    def test_wrong_key_rejected(self) -> None:
-        payload = {"sub": "user-1", "exp": time.time() + 3600}
-        token = create_jwt(payload, _SIGNING_KEY)
-        claims = decode_jwt(token, "wrong-key")
+    def test_wrong_key_rejected(self, user_token: str) -> None:
+        claims = decode_jwt(user_token, "wrong-key")
         assert claims is None
 
     def test_malformed_token_rejected(self) -> None:
@@ -54,16 +70,12 @@ class TestDecodeJwt:
         payload = {"sub": "user-1", "role": "admin"}
         token = create_jwt(payload, _SIGNING_KEY)
         parts = token.split(".")
-        # Tamper with payload
-        import base64
-
-        tampered = base64.urlsafe_b64encode(b'{"sub":"hacker","role":"admin"}').rstrip(b"=")
-        parts[1] = tampered.decode()
+        parts[1] = _TAMPERED_PAYLOAD_SEGMENT
         tampered_token = ".".join(parts)
         assert decode_jwt(tampered_token, _SIGNING_KEY) is None
 class TestCreateJwt:
     def test_roundtrip(self) -> None:
-        payload = {"sub": "user-1", "iss": "test", "exp": time.time() + 3600}
+        payload = {"sub": "user-1", "iss": "test", "exp": _NOW + 3600}
         token = create_jwt(payload, _SIGNING_KEY)
         claims = decode_jwt(token, _SIGNING_KEY)
         assert claims is not None
@@ -74,6 +86,23 @@ class TestCreateJwt:
         token = create_jwt({"sub": "x"}, _SIGNING_KEY)
         parts = token.split(".")
         assert len(parts) == 3
+
+    def test_cached_key_state_not_mutated(self) -> None:
+        first = create_jwt({"sub": "a"}, _SIGNING_KEY)
+        second = create_jwt({"sub": "b"}, _SIGNING_KEY)
+        for token in (first, second):
+            header_b64, payload_b64, signature_b64 = token.split(".")
+            expected = hmac.new(
+                _SIGNING_KEY.encode(), f"{header_b64}.{payload_b64}".encode(), hashlib.sha256
+            ).digest()
+            assert _b64url_decode(signature_b64) == expected
+
+    def test_rotated_keys_are_not_retained(self) -> None:
+        _keyed_hmac.cache_clear()
+        for key in ("key-v1", "key-v2", "key-v3"):
+            token = create_jwt({"sub": "a", "exp": _NOW + 60}, key)
+            assert decode_jwt(token, key) is not None
+        assert _keyed_hmac.cache_info().currsize == 2
 class TestExtractUserIdentity:
     def test_extracts_sub_and_role(self) -> None:
         claims = {"sub": "user-99", "role": "admin"}
@@ -91,6 +120,15 @@ class TestExtractUserIdentity:
         identity = extract_user_identity(claims)
         assert identity["role"] == "user"
 class TestJwtAuthorizerHandler:
+    @pytest.fixture(autouse=True)
+    def _env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JWT_SECRET_NAME", "test/jwt-secret")
+
+    @pytest.fixture(autouse=True)
+    def _mock_secret(self) -> Iterator[MagicMock]:
+        with patch("runtime.auth.jwt_authorizer.get_secret", return_value=_SIGNING_KEY) as m:
+            yield m
+
     def _token_event(self, token: str) -> dict[str, Any]:
         return {
             "type": "TOKEN",
@@ -105,47 +143,28 @@ class TestJwtAuthorizerHandler:
             "methodArn": _METHOD_ARN,
         }
 
-    @patch.dict(os.environ, {"JWT_SECRET_NAME": "test/jwt-secret"})
-    @patch("runtime.auth.jwt_authorizer.get_secret")
-    def test_valid_token_allowed(self, mock_get_secret: Any) -> None:
-        mock_get_secret.return_value = _SIGNING_KEY
-        payload = {"sub": "user-1", "role": "user", "exp": time.time() + 3600}
-        token = create_jwt(payload, _SIGNING_KEY)
-
-        result = handler(self._token_event(token), None)
+    def test_valid_token_allowed(self, user_token: str) -> None:
+        result = handler(self._token_event(user_token), None)
 
         assert result["principalId"] == "user-1"
         stmt = result["policyDocument"]["Statement"][0]
         assert stmt["Effect"] == "Allow"
         assert result["context"]["auth_type"] == "jwt"
 
-    @patch.dict(os.environ, {"JWT_SECRET_NAME": "test/jwt-secret"})
-    @patch("runtime.auth.jwt_authorizer.get_secret")
-    def test_request_authorizer(self, mock_get_secret: Any) -> None:
-        mock_get_secret.return_value = _SIGNING_KEY
-        payload = {"sub": "user-2", "role": "admin", "exp": time.time() + 3600}
-        token = create_jwt(payload, _SIGNING_KEY)
-
-        result = handler(self._request_event(token), None)
+    def test_request_authorizer(self, admin_token: str) -> None:
+        result = handler(self._request_event(admin_token), None)
 
         assert result["principalId"] == "user-2"
         stmt = result["policyDocument"]["Statement"][0]
         assert stmt["Effect"] == "Allow"
 
-    @patch.dict(os.environ, {"JWT_SECRET_NAME": "test/jwt-secret"})
-    @patch("runtime.auth.jwt_authorizer.get_secret")
-    def test_expired_token_denied(self, mock_get_secret: Any) -> None:
-        mock_get_secret.return_value = _SIGNING_KEY
-        payload = {"sub": "user-1", "exp": time.time() - 100}
-        token = create_jwt(payload, _SIGNING_KEY)
-
-        result = handler(self._token_event(token), None)
+    def test_expired_token_denied(self, expired_token: str) -> None:
+        result = handler(self._token_event(expired_token), None)
 
         assert result["principalId"] == "anonymous"
         stmt = result["policyDocument"]["Statement"][0]
         assert stmt["Effect"] == "Deny"
 
-    @patch.dict(os.environ, {"JWT_SECRET_NAME": "test/jwt-secret"})
     def test_missing_bearer_token_denied(self) -> None:
         event = {"methodArn": _METHOD_ARN}
         result = handler(event, None)
@@ -154,8 +173,8 @@ class TestJwtAuthorizerHandler:
         stmt = result["policyDocument"]["Statement"][0]
         assert stmt["Effect"] == "Deny"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_missing_env_var_denied(self) -> None:
+    def test_missing_env_var_denied(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("JWT_SECRET_NAME", raising=False)
         event = self._token_event("some-token")
         result = handler(event, None)
 
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import io
 import json
-import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -22,6 +22,30 @@ from runtime.shared.llm_provider import (
     create_llm_provider,
 )
 
+# Response bodies are encoded once. Tests wrap them in a fresh io.BytesIO, which
+# already provides the read() and context-manager protocol urlopen returns.
+_OPENAI_WORLD_BYTES = json.dumps({
+    "choices": [{"message": {"content": "world"}}],
+    "model": "gpt-4",
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+}).encode()
+_OPENAI_OK_BYTES = json.dumps({
+    "choices": [{"message": {"content": "ok"}}],
+    "model": "gpt-4",
+    "usage": {},
+}).encode()
+_ANTHROPIC_HI_THERE_BYTES = json.dumps({
+    "content": [{"type": "text", "text": "hi there"}],
+    "model": "claude-3-opus-20240229",
+    "usage": {"input_tokens": 10, "output_tokens": 5},
+}).encode()
+
+
+@pytest.fixture()
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make retry backoff in the provider module return immediately."""
+    monkeypatch.setattr("runtime.shared.llm_provider.time.sleep", lambda _seconds: None)
+
 
 class TestLLMRequest:
     def test_valid_request(self):
@@ -78,11 +102,13 @@ class TestCircuitBreaker:
         cb.record_failure()
         assert cb.state == CircuitState.CLOSED
 
-    def test_half_open_after_recovery_timeout(self):
+    def test_half_open_after_recovery_timeout(self, monkeypatch: pytest.MonkeyPatch):
+        now = [1000.0]
+        monkeypatch.setattr("runtime.shared.llm_provider.time.monotonic", lambda: now[0])
         cb = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.01)
         cb.record_failure()
         assert cb.state == CircuitState.OPEN
-        time.sleep(0.02)
+        now[0] += 1.0
         assert cb.state == CircuitState.HALF_OPEN
         assert cb.allow_request()
 
@@ -91,25 +117,9 @@ class TestOpenAIProvider:
     def _make_provider(self, **kwargs: Any) -> OpenAIProvider:
         return OpenAIProvider("test-key", max_retries=1, **kwargs)
 
-    def _openai_response(self, content: str = "hello") -> dict[str, Any]:
-        return {
-            "choices": [{"message": {"content": content}}],
-            "model": "gpt-4",
-            "usage": {
-                "prompt_tokens": 10,
-                "completion_tokens": 5,
-                "total_tokens": 15,
-            },
-        }
-
     @patch("urllib.request.urlopen")
     def test_successful_completion(self, mock_urlopen: MagicMock):
-        resp_data = json.dumps(self._openai_response("world")).encode()
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = resp_data
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_urlopen.return_value = io.BytesIO(_OPENAI_WORLD_BYTES)
 
         provider = self._make_provider()
         req = LLMRequest(messages=[{"role": "user", "content": "hi"}], model="gpt-4")
@@ -124,7 +134,7 @@ class TestOpenAIProvider:
         import urllib.error
 
         exc = urllib.error.HTTPError(
-            "url", 401, "Unauthorized", {}, MagicMock(read=lambda: b'{}')
+            "url", 401, "Unauthorized", {}, io.BytesIO(b"{}")
         )
         mock_urlopen.side_effect = exc
 
@@ -134,18 +144,17 @@ class TestOpenAIProvider:
             provider.complete(req)
         assert mock_urlopen.call_count == 1
 
+    @pytest.mark.usefixtures("no_sleep")
     @patch("urllib.request.urlopen")
     def test_rate_limit_retried(self, mock_urlopen: MagicMock):
         import urllib.error
 
         exc = urllib.error.HTTPError(
-            "url", 429, "Too Many Requests", {}, MagicMock(read=lambda: b'{}')
+            "url", 429, "Too Many Requests", {}, io.BytesIO(b"{}")
         )
         mock_urlopen.side_effect = exc
 
-        provider = OpenAIProvider(
-            "test-key", max_retries=2, initial_delay_ms=1, max_delay_ms=1
-        )
+        provider = OpenAIProvider("test-key", max_retries=2)
         req = LLMRequest(messages=[{"role": "user", "content": "hi"}], model="gpt-4")
         with pytest.raises(LLMProviderError, match="all 2 attempts failed"):
             provider.complete(req)
@@ -177,21 +186,9 @@ class TestAnthropicProvider:
     def _make_provider(self, **kwargs: Any) -> AnthropicProvider:
         return AnthropicProvider("test-key", max_retries=1, **kwargs)
 
-    def _anthropic_response(self, content: str = "hello") -> dict[str, Any]:
-        return {
-            "content": [{"type": "text", "text": content}],
-            "model": "claude-3-opus-20240229",
-            "usage": {"input_tokens": 10, "output_tokens": 5},
-        }
-
     @patch("urllib.request.urlopen")
     def test_successful_completion(self, mock_urlopen: MagicMock):
-        resp_data = json.dumps(self._anthropic_response("hi there")).encode()
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = resp_data
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_urlopen.return_value = io.BytesIO(_ANTHROPIC_HI_THERE_BYTES)
 
         provider = self._make_provider()
         req = LLMRequest(
@@ -264,24 +261,16 @@ class TestCreateLLMProvider:
 
 
 class TestRetryAndCircuitBreaker:
+    @pytest.mark.usefixtures("no_sleep")
     @patch("urllib.request.urlopen")
     def test_retry_with_backoff(self, mock_urlopen: MagicMock):
         import urllib.error
 
-        success_data = json.dumps({
-            "choices": [{"message": {"content": "ok"}}],
-            "model": "gpt-4",
-            "usage": {},
-        }).encode()
-        mock_success = MagicMock()
-        mock_success.read.return_value = success_data
-        mock_success.__enter__ = lambda s: s
-        mock_success.__exit__ = MagicMock(return_value=False)
-
-        exc = urllib.error.HTTPError("url", 500, "Server Error", {}, MagicMock(read=lambda: b'{}'))
-        mock_urlopen.side_effect = [exc, mock_success]
+        success = io.BytesIO(_OPENAI_OK_BYTES)
+        exc = urllib.error.HTTPError("url", 500, "Server Error", {}, io.BytesIO(b"{}"))
+        mock_urlopen.side_effect = [exc, success]
 
-        provider = OpenAIProvider("key", max_retries=2, initial_delay_ms=1, max_delay_ms=1)
+        provider = OpenAIProvider("key", max_retries=2)
         req = LLMRequest(messages=[{"role": "user", "content": "hi"}], model="gpt-4")
         result = provider.complete(req)
 
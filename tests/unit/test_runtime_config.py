@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -17,34 +18,47 @@ _REQUIRED_ENV = {
     "EVENT_BUS_NAME": "bus",
 }
 class TestLoadRuntimeConfig:
-    def test_defaults(self) -> None:
-        with patch.dict(os.environ, _REQUIRED_ENV, clear=True):
+    @pytest.mark.parametrize(
+        ("extra_env", "expected"),
+        [
+            pytest.param(
+                {},
+                {
+                    "stage": "dev",
+                    "aws_region": "us-east-1",
+                    "secrets_prefix": "realtime-agentic-api",
+                    "cache_port": 6379,
+                    "dynamodb_endpoint": None,
+                    "eventbridge_endpoint": None,
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                {
+                    "STAGE": "staging",
+                    "AWS_REGION": "us-west-2",
+                    "SECRETS_PREFIX": "custom",
+                    "CACHE_PORT": "6380",
+                    "DYNAMODB_ENDPOINT": "http://localhost:8000",
+                    "EVENTBRIDGE_ENDPOINT": "http://localhost:4010",
+                },
+                {
+                    "stage": "staging",
+                    "aws_region": "us-west-2",
+                    "secrets_prefix": "custom",
+                    "cache_port": 6380,
+                    "dynamodb_endpoint": "http://localhost:8000",
+                    "eventbridge_endpoint": "http://localhost:4010",
+                },
+                id="optional-overrides",
+            ),
+        ],
+    )
+    def test_load(self, extra_env: dict[str, str], expected: dict[str, Any]) -> None:
+        with patch.dict(os.environ, {**_REQUIRED_ENV, **extra_env}, clear=True):
             config = load_runtime_config()
 
-        assert config.stage == "dev"
-        assert config.aws_region == "us-east-1"
-        assert config.secrets_prefix == "realtime-agentic-api"
-        assert config.cache_port == 6379
-
-    def test_optional_overrides(self) -> None:
-        env = {
-            **_REQUIRED_ENV,
-            "STAGE": "staging",
-            "AWS_REGION": "us-west-2",
-            "SECRETS_PREFIX": "custom",
-            "CACHE_PORT": "6380",
-            "DYNAMODB_ENDPOINT": "http://localhost:8000",
-            "EVENTBRIDGE_ENDPOINT": "http://localhost:4010",
-        }
-        with patch.dict(os.environ, env, clear=True):
-            config = load_runtime_config()
-
-        assert config.stage == "staging"
-        assert config.aws_region == "us-west-2"
-        assert config.secrets_prefix == "custom"
-        assert config.cache_port == 6380
-        assert config.dynamodb_endpoint == "http://localhost:8000"
-        assert config.eventbridge_endpoint == "http://localhost:4010"
+        assert {field: getattr(config, field) for field in expected} == expected
 
     def test_missing_required_env_raises(self) -> None:
         with patch.dict(os.environ, {}, clear=True):
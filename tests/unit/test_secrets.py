@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
+import importlib
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError
 
-from runtime.shared.secrets import clear_cache, get_secret, get_secret_json
+from runtime.shared.secrets import (
+    _reset_clients,
+    clear_cache,
+    get_secret,
+    get_secret_json,
+    get_secrets,
+)
 
 
 class TestSecrets:
     def setup_method(self) -> None:
         clear_cache()
+        _reset_clients()
 
     def test_get_secret_caches_value(self) -> None:
         client = MagicMock()
@@ -26,6 +34,23 @@ class TestSecrets:
         mock_client.assert_called_once_with("secretsmanager", region_name=None)
         client.get_secret_value.assert_called_once_with(SecretId="my/secret")
 
+    def test_get_secret_refetches_after_ttl(self) -> None:
+        client = MagicMock()
+        client.get_secret_value.return_value = {"SecretString": "value"}
+        now = [1000.0]
+
+        with (
+            patch("runtime.shared.secrets.boto3.client", return_value=client),
+            patch("runtime.shared.secrets.time.monotonic", side_effect=lambda: now[0]),
+        ):
+            get_secret("my/secret", max_age_s=60)
+            now[0] += 59
+            get_secret("my/secret", max_age_s=60)
+            now[0] += 1
+            get_secret("my/secret", max_age_s=60)
+
+        assert client.get_secret_value.call_count == 2
+
     def test_get_secret_json_parses(self) -> None:
         client = MagicMock()
         client.get_secret_value.return_value = {"SecretString": json.dumps({"ok": True})}
@@ -42,7 +67,7 @@ class TestSecrets:
             with pytest.raises(ClientError):
                 get_secret("missing")
 
-    def test_clear_cache_resets_client(self) -> None:
+    def test_clear_cache_keeps_client(self) -> None:
         client = MagicMock()
         client.get_secret_value.return_value = {"SecretString": "value"}
 
@@ -51,4 +76,66 @@ class TestSecrets:
             clear_cache()
             get_secret("my/secret")
 
-        assert mock_client.call_count == 2
+        mock_client.assert_called_once()
+        assert client.get_secret_value.call_count == 2
+
+    def test_client_built_at_import_when_region_set(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import runtime.shared.secrets as secrets
+
+        monkeypatch.setenv("AWS_REGION", "us-east-1")
+        client = MagicMock()
+        with patch("boto3.client", return_value=client) as mock_client:
+            importlib.reload(secrets)
+
+        try:
+            mock_client.assert_called_once_with("secretsmanager", region_name=None)
+            assert secrets._secrets_clients == {None: client}
+        finally:
+            secrets._reset_clients()
+
+    def test_get_secrets_batches_and_caches(self) -> None:
+        names = [f"app/secret-{i}" for i in range(5)]
+        client = MagicMock()
+        client.batch_get_secret_value.return_value = {
+            "SecretValues": [
+                {"ARN": f"arn:{name}", "Name": name, "SecretString": json.dumps({"n": name})}
+                for name in names
+            ],
+            "Errors": [],
+        }
+
+        with patch("runtime.shared.secrets.boto3.client", return_value=client):
+            result = get_secrets(names, as_json=True)
+            assert get_secret(names[0]) == json.dumps({"n": names[0]})
+
+        assert result == {name: {"n": name} for name in names}
+        client.batch_get_secret_value.assert_called_once_with(SecretIdList=names)
+        client.get_secret_value.assert_not_called()
+
+    def test_get_secrets_chunks_by_twenty(self) -> None:
+        names = [f"app/secret-{i}" for i in range(45)]
+        client = MagicMock()
+        client.batch_get_secret_value.side_effect = lambda SecretIdList: {
+            "SecretValues": [{"Name": n, "SecretString": n} for n in SecretIdList],
+        }
+
+        with patch("runtime.shared.secrets.boto3.client", return_value=client):
+            assert get_secrets(names) == {name: name for name in names}
+
+        calls = client.batch_get_secret_value.call_args_list
+        assert [len(c.kwargs["SecretIdList"]) for c in calls] == [20, 20, 5]
+
+    def test_get_secrets_errors_still_raise(self) -> None:
+        client = MagicMock()
+        client.batch_get_secret_value.return_value = {
+            "SecretValues": [{"Name": "ok", "SecretString": "value"}],
+            "Errors": [{"SecretId": "missing", "ErrorCode": "ResourceNotFoundException"}],
+        }
+        client.get_secret_value.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException"}}, "GetSecretValue"
+        )
+
+        with patch("runtime.shared.secrets.boto3.client", return_value=client):
+            assert get_secrets(["ok", "missing"]) == {"ok": "value"}
+            with pytest.raises(ClientError):
+                get_secret("missing")
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import sys
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -11,9 +13,43 @@ import pytest
 from runtime.handlers.task_processing import (
     _error_response,
     _handle_task_failure,
+    _init,
     _process_task,
+    _register_snapstart_hooks,
     handler,
 )
+from runtime.repositories.base_repository import ItemNotFoundError
+
+Call = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+
+class _Recorder:
+    """Plain stand-in for a repository or publisher.
+
+    Any public method call is recorded as ``(name, args, kwargs)`` and returns
+    ``returns[name]`` (``None`` if unset); exception instances are raised.
+    """
+
+    def __init__(self, **returns: Any) -> None:
+        self.returns = returns
+        self.calls: list[Call] = []
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            self.calls.append((name, args, kwargs))
+            result = self.returns.get(name)
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        return method
+
+    def called(self, name: str) -> list[Call]:
+        """Return the recorded calls to *name*."""
+        return [c for c in self.calls if c[0] == name]
 
 
 class TestHandler:
@@ -53,11 +89,35 @@ class TestHandler:
         result = handler(event, None)
         assert result["taskId"] == "t2"
 
-    def test_handler_missing_fields(self) -> None:
+    @patch("runtime.handlers.task_processing._init")
+    @patch("runtime.handlers.task_processing._process_task")
+    def test_handler_warmer_ping(self, mock_process: MagicMock, mock_init: MagicMock) -> None:
+        assert handler({"warmer": True}, None) == {"warmed": True}
+        mock_init.assert_called_once_with()
+        mock_process.assert_not_called()
+
+    @patch("runtime.handlers.task_processing._init")
+    def test_handler_missing_fields(self, mock_init: MagicMock) -> None:
         event = {"detail": {"taskId": ""}}
         result = handler(event, None)
         assert result["status"] == "error"
-        assert "Missing required" in result["message"]
+        assert result["message"] == "Missing required fields: taskId, agentId"
+        mock_init.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("event", "message"),
+        [
+            ({"agentId": "a1"}, "Missing required fields: taskId"),
+            ({"taskId": "t1"}, "Missing required fields: agentId"),
+        ],
+    )
+    def test_handler_missing_field_response_is_not_shared(
+        self, event: dict[str, Any], message: str
+    ) -> None:
+        result = handler(event, None)
+        assert result == {"status": "error", "message": message}
+        result["headers"] = {"X-Trace": "1"}
+        assert handler(dict(event), None) == {"status": "error", "message": message}
 
     @patch("runtime.handlers.task_processing._init")
     @patch("runtime.handlers.task_processing._process_task")
@@ -77,37 +137,33 @@ class TestHandler:
 class TestProcessTask:
     """Tests for _process_task function."""
 
-    def _setup_mocks(self) -> dict[str, MagicMock]:
-        config = MagicMock()
-        config.aws_region = "us-east-1"
+    def _setup_mocks(self) -> dict[str, Any]:
+        config = SimpleNamespace(aws_region="us-east-1")
 
-        agent_repo = MagicMock()
-        agent_repo.get_agent.return_value = {
-            "agentId": "a1",
-            "configuration": {},
-        }
+        agent_repo = _Recorder(get_agent={"agentId": "a1", "configuration": {}})
 
-        task_repo = MagicMock()
-        task_repo.get_task.return_value = {
-            "taskId": "t1",
-            "agentId": "a1",
-            "description": "Test task",
-            "status": "pending",
-        }
-        task_repo.update_task_status.return_value = {}
-        task_repo.update_task_plan.return_value = {}
-        task_repo.update_current_step.return_value = {}
-        task_repo.update_task_result.return_value = {}
-
-        context_repo = MagicMock()
-        context_repo.get_latest_context.return_value = {
-            "conversationHistory": [],
-            "agentMemory": {},
-        }
+        task_repo = _Recorder(
+            get_task={
+                "taskId": "t1",
+                "agentId": "a1",
+                "description": "Test task",
+                "status": "pending",
+            },
+            update_task_status={},
+            update_task_plan={},
+            update_current_step={},
+            update_task_result={},
+        )
+
+        context_repo = _Recorder(
+            get_latest_context={"conversationHistory": [], "agentMemory": {}},
+        )
 
-        publisher = MagicMock()
-        publisher.publish_task_progress.return_value = "event-id"
-        publisher.publish_task_completed.return_value = "event-id"
+        publisher = _Recorder(
+            flush=["event-id"],
+            publish_task_progress="event-id",
+            publish_task_completed="event-id",
+        )
 
         return {
             "config": config,
@@ -152,6 +208,8 @@ class TestProcessTask:
         )
         mock_cap.manage_memory.return_value = ([], {})
         mock_cap_cls.return_value = mock_cap
+        # One log across both so the relative order of their calls is visible.
+        mocks["agent_repo"].calls = mocks["publisher"].calls
 
         result = _process_task(
             task_id="t1",
@@ -162,7 +220,20 @@ class TestProcessTask:
         assert result["status"] == "completed"
         assert result["taskId"] == "t1"
         assert len(result["steps"]) == 1
-        mocks["publisher"].publish_task_completed.assert_called_once()
+        # Step progress is flushed ahead of TaskCompleted, which goes out
+        # before the agent is reported idle.
+        assert [name for name, _, _ in mocks["publisher"].calls] == [
+            "get_agent",
+            "update_agent_status",
+            "queue_task_progress",
+            "flush",
+            "publish_task_completed",
+            "update_agent_status",
+            "publish_task_progress",
+        ]
+        assert mocks["task_repo"].called("update_current_step") == [
+            ("update_current_step", ("a1", "t1", 0), {})
+        ]
 
     @patch("runtime.handlers.task_processing.AgentCapabilities")
     @patch("runtime.handlers.task_processing.create_agent_from_db_config")
@@ -200,20 +271,39 @@ class TestProcessTask:
 
         assert result["status"] == "failed"
 
-    def test_process_task_agent_not_found(self) -> None:
-        from runtime.repositories.base_repository import ItemNotFoundError
+    @patch("runtime.handlers.task_processing.AgentCapabilities")
+    @patch("runtime.handlers.task_processing.create_agent_from_db_config")
+    @patch("runtime.handlers.task_processing.ToolRegistry")
+    def test_process_task_without_stored_context(
+        self,
+        mock_registry_cls: MagicMock,
+        mock_create_agent: MagicMock,
+        mock_cap_cls: MagicMock,
+    ) -> None:
+        mocks = self._setup_mocks()
+        mocks["context_repo"].returns["get_latest_context"] = None
+        mock_cap = MagicMock()
+        mock_cap.plan_task.return_value = MagicMock(steps=[], to_dict=lambda: {"steps": []})
+        mock_cap.manage_memory.side_effect = lambda history, memory: (history, memory)
+        mock_cap_cls.return_value = mock_cap
+
+        result = _process_task(task_id="t1", agent_id="a1", **mocks)
+
+        assert result["status"] == "completed"
+        [(_, _, kwargs)] = mocks["context_repo"].called("put_context")
+        assert [m["role"] for m in kwargs["conversation_history"]] == ["user", "assistant"]
+        assert kwargs["agent_memory"] == {}
 
+    def test_process_task_agent_not_found(self) -> None:
         mocks = self._setup_mocks()
-        mocks["agent_repo"].get_agent.side_effect = ItemNotFoundError("Not found")
+        mocks["agent_repo"].returns["get_agent"] = ItemNotFoundError("Not found")
 
         result = _process_task(task_id="t1", agent_id="a1", **mocks)
         assert result["status"] == "error"
 
     def test_process_task_task_not_found(self) -> None:
-        from runtime.repositories.base_repository import ItemNotFoundError
-
         mocks = self._setup_mocks()
-        mocks["task_repo"].get_task.side_effect = ItemNotFoundError("Not found")
+        mocks["task_repo"].returns["get_task"] = ItemNotFoundError("Not found")
 
         result = _process_task(task_id="t1", agent_id="a1", **mocks)
         assert result["status"] == "error"
@@ -223,8 +313,8 @@ class TestHandleTaskFailure:
     """Tests for _handle_task_failure function."""
 
     def test_publishes_failure_events(self) -> None:
-        task_repo = MagicMock()
-        publisher = MagicMock()
+        task_repo = _Recorder()
+        publisher = _Recorder()
 
         _handle_task_failure(
             task_id="t1",
@@ -234,15 +324,34 @@ class TestHandleTaskFailure:
             publisher=publisher,
         )
 
-        task_repo.update_task_status.assert_called_once_with("a1", "t1", "failed")
-        task_repo.update_task_result.assert_called_once()
-        publisher.publish_task_completed.assert_called_once()
-        publisher.publish_error_occurred.assert_called_once()
+        assert task_repo.called("update_task_status") == [
+            ("update_task_status", ("a1", "t1", "failed"), {})
+        ]
+        assert len(task_repo.called("update_task_result")) == 1
+        assert [name for name, _, _ in publisher.calls] == [
+            "flush",
+            "publish_task_completed",
+            "publish_error_occurred",
+        ]
+
+    def test_flush_failure_still_marks_task_failed(self) -> None:
+        task_repo = _Recorder()
+        publisher = _Recorder(flush=RuntimeError("PutEvents down"))
+
+        _handle_task_failure(
+            task_id="t1",
+            agent_id="a1",
+            error="Something broke",
+            task_repo=task_repo,
+            publisher=publisher,
+        )
+
+        assert len(task_repo.called("update_task_status")) == 1
+        assert len(publisher.called("publish_task_completed")) == 1
 
     def test_handles_exception_gracefully(self) -> None:
-        task_repo = MagicMock()
-        task_repo.update_task_status.side_effect = RuntimeError("DB error")
-        publisher = MagicMock()
+        task_repo = _Recorder(update_task_status=RuntimeError("DB error"))
+        publisher = _Recorder()
 
         # Should not raise
         _handle_task_failure(
@@ -254,6 +363,47 @@ class TestHandleTaskFailure:
         )
 
 
+class TestInit:
+    """Tests for _init cold-start initialisation."""
+
+    def test_init_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in ("AGENTS_TABLE", "TASKS_TABLE", "CONTEXT_TABLE", "CONNECTIONS_TABLE"):
+            monkeypatch.setenv(name, name.lower())
+        monkeypatch.setenv("EVENT_BUS_NAME", "bus")
+        monkeypatch.setenv("AWS_REGION", "us-east-1")
+        _init.cache_clear()
+        try:
+            assert _init() is _init()
+        finally:
+            _init.cache_clear()
+
+    def test_snapstart_init_primes_and_clears_after_restore(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        restore_hooks = MagicMock()
+        monkeypatch.setitem(sys.modules, "snapshot_restore_py", restore_hooks)
+        monkeypatch.setenv("AWS_LAMBDA_INITIALIZATION_TYPE", "snap-start")
+        mock_init = MagicMock()
+        monkeypatch.setattr("runtime.handlers.task_processing._init", mock_init)
+
+        _register_snapstart_hooks()
+
+        mock_init.assert_called_once_with()
+        restore_hooks.register_after_restore.assert_called_once_with(mock_init.cache_clear)
+
+    def test_no_priming_outside_snapstart(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        restore_hooks = MagicMock()
+        monkeypatch.setitem(sys.modules, "snapshot_restore_py", restore_hooks)
+        monkeypatch.setenv("AWS_LAMBDA_INITIALIZATION_TYPE", "on-demand")
+        mock_init = MagicMock()
+        monkeypatch.setattr("runtime.handlers.task_processing._init", mock_init)
+
+        _register_snapstart_hooks()
+
+        mock_init.assert_not_called()
+        restore_hooks.register_after_restore.assert_not_called()
+
+
 class TestErrorResponse:
     """Tests for _error_response helper."""
 
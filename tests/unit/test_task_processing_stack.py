@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import replace
+
 import aws_cdk as cdk
+import pytest
 from aws_cdk import aws_dynamodb as dynamodb
 from aws_cdk import aws_events as events
 from aws_cdk.assertions import Match, Template
@@ -10,109 +14,95 @@ from aws_cdk.assertions import Match, Template
 from infra.config import EnvironmentConfig
 from infra.task_processing_stack import TaskProcessingStack
 
+pytestmark = pytest.mark.usefixtures("cdk_warmup")
+
+
+@pytest.fixture(scope="module")
+def build_stack() -> Callable[..., cdk.Stack]:
+    def build(app: cdk.App, config: EnvironmentConfig, env: cdk.Environment) -> cdk.Stack:
+        stage = config.stage.capitalize()
+        support = cdk.Stack(app, f"Support{stage}", env=env)
+        agents_table = dynamodb.Table(
+            support,
+            "AgentsTable",
+            table_name="test-agents",
+            partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+        )
+        tasks_table = dynamodb.Table(
+            support,
+            "TasksTable",
+            table_name="test-tasks",
+            partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+        )
+        context_table = dynamodb.Table(
+            support,
+            "ContextTable",
+            table_name="test-context",
+            partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
+        )
+        bus = events.EventBus(support, "EventBus", event_bus_name="test-events")
+
+        return TaskProcessingStack(
+            app,
+            f"TestTaskProcessing{stage}",
+            config=config,
+            agents_table=agents_table,
+            tasks_table=tasks_table,
+            context_table=context_table,
+            event_bus=bus,
+            env=env,
+        )
+
+    return build
+
 
-def _dev_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="dev",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        nat_gateways=0,
-        tags={"Environment": "dev"},
-    )
-
-
-def _prod_config() -> EnvironmentConfig:
-    return EnvironmentConfig(
-        stage="prod",
-        aws_account_id="123456789012",
-        aws_region="us-east-1",
-        max_azs=3,
-        nat_gateways=2,
-        lambda_memory_mb=512,
-        tags={"Environment": "prod"},
-    )
-
-
-def _synth_template(config: EnvironmentConfig | None = None) -> Template:
-    config = config or _dev_config()
-    app = cdk.App()
-    env = cdk.Environment(account=config.aws_account_id, region=config.aws_region)
-
-    support = cdk.Stack(app, "Support", env=env)
-    agents_table = dynamodb.Table(
-        support,
-        "AgentsTable",
-        table_name="test-agents",
-        partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
-        sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
-    )
-    tasks_table = dynamodb.Table(
-        support,
-        "TasksTable",
-        table_name="test-tasks",
-        partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
-        sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
-    )
-    context_table = dynamodb.Table(
-        support,
-        "ContextTable",
-        table_name="test-context",
-        partition_key=dynamodb.Attribute(name="PK", type=dynamodb.AttributeType.STRING),
-        sort_key=dynamodb.Attribute(name="SK", type=dynamodb.AttributeType.STRING),
-    )
-    bus = events.EventBus(support, "EventBus", event_bus_name="test-events")
-
-    stack = TaskProcessingStack(
-        app,
-        "TestTaskProcessing",
-        config=config,
-        agents_table=agents_table,
-        tasks_table=tasks_table,
-        context_table=context_table,
-        event_bus=bus,
-        env=env,
-    )
-    return Template.from_stack(stack)
+@pytest.fixture(scope="module")
+def stack_configs(stack_configs: tuple[EnvironmentConfig, ...]) -> tuple[EnvironmentConfig, ...]:
+    dev, prod = stack_configs
+    return (dev, replace(prod, lambda_memory_mb=512, task_provisioned_concurrency=2))
 
 
 class TestTaskProcessingStackDev:
     """Tests for TaskProcessingStack in dev environment."""
 
-    def test_lambda_function_created(self) -> None:
-        template = _synth_template()
-        template.resource_count_is("AWS::Lambda::Function", 1)
+    def test_lambda_function_created(self, dev_template: Template) -> None:
+        dev_template.resource_count_is("AWS::Lambda::Function", 1)
 
-    def test_lambda_runtime(self) -> None:
-        template = _synth_template()
-        template.has_resource_properties(
+    def test_lambda_runtime(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::Lambda::Function",
-            {"Runtime": "python3.11"},
+            {"Runtime": "python3.12"},
         )
 
-    def test_lambda_handler(self) -> None:
-        template = _synth_template()
-        template.has_resource_properties(
+    def test_lambda_architecture(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
+            "AWS::Lambda::Function",
+            {"Architectures": ["arm64"]},
+        )
+
+    def test_lambda_handler(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::Lambda::Function",
             {"Handler": "runtime.handlers.task_processing.handler"},
         )
 
-    def test_lambda_memory_size(self) -> None:
-        template = _synth_template()
-        template.has_resource_properties(
+    def test_lambda_memory_size(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::Lambda::Function",
             {"MemorySize": 1024},
         )
 
-    def test_lambda_timeout(self) -> None:
-        template = _synth_template()
-        template.has_resource_properties(
+    def test_lambda_timeout(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::Lambda::Function",
             {"Timeout": 300},
         )
 
-    def test_lambda_environment_variables(self) -> None:
-        template = _synth_template()
-        template.has_resource_properties(
+    def test_lambda_environment_variables(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::Lambda::Function",
             {
                 "Environment": {
@@ -123,21 +113,46 @@ class TestTaskProcessingStackDev:
             },
         )
 
-    def test_ssm_parameter_created(self) -> None:
-        template = _synth_template()
-        template.has_resource_properties(
+    def test_snapstart_enabled(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
+            "AWS::Lambda::Function",
+            {"SnapStart": {"ApplyOn": "PublishedVersions"}},
+        )
+
+    def test_live_alias_created(self, dev_template: Template) -> None:
+        dev_template.resource_count_is("AWS::Lambda::Version", 1)
+        dev_template.has_resource_properties("AWS::Lambda::Alias", {"Name": "live"})
+
+    def test_no_provisioned_concurrency(self, dev_template: Template) -> None:
+        alias = dev_template.find_resources("AWS::Lambda::Alias")
+        assert all(
+            "ProvisionedConcurrencyConfig" not in r["Properties"] for r in alias.values()
+        )
+
+    def test_warmer_rule(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
+            "AWS::Events::Rule",
+            {
+                "ScheduleExpression": "rate(5 minutes)",
+                "Targets": [Match.object_like({"Input": '{"warmer":true}'})],
+            },
+        )
+
+    def test_ssm_parameter_created(self, dev_template: Template) -> None:
+        (alias_id,) = dev_template.find_resources("AWS::Lambda::Alias")
+        dev_template.has_resource_properties(
             "AWS::SSM::Parameter",
-            {"Description": "Task processing Lambda ARN"},
+            {"Description": "Task processing Lambda ARN (live alias)", "Value": {"Ref": alias_id}},
         )
 
-    def test_outputs_created(self) -> None:
-        template = _synth_template()
-        outputs = template.find_outputs("TaskProcessingFnArn")
+    def test_outputs_created(self, dev_template: Template) -> None:
+        (alias_id,) = dev_template.find_resources("AWS::Lambda::Alias")
+        outputs = dev_template.find_outputs("TaskProcessingFnArn")
         assert len(outputs) == 1
+        assert outputs["TaskProcessingFnArn"]["Value"] == {"Ref": alias_id}
 
-    def test_bedrock_iam_policy(self) -> None:
-        template = _synth_template()
-        template.has_resource_properties(
+    def test_bedrock_iam_policy(self, dev_template: Template) -> None:
+        dev_template.has_resource_properties(
             "AWS::IAM::Policy",
             {
                 "PolicyDocument": {
@@ -162,13 +177,26 @@ class TestTaskProcessingStackDev:
 class TestTaskProcessingStackProd:
     """Tests for TaskProcessingStack in prod environment."""
 
-    def test_lambda_function_created(self) -> None:
-        template = _synth_template(_prod_config())
-        template.resource_count_is("AWS::Lambda::Function", 1)
+    def test_lambda_function_created(self, prod_template: Template) -> None:
+        prod_template.resource_count_is("AWS::Lambda::Function", 1)
+
+    def test_provisioned_concurrency(self, prod_template: Template) -> None:
+        prod_template.has_resource_properties(
+            "AWS::Lambda::Alias",
+            {
+                "Name": "live",
+                "ProvisionedConcurrencyConfig": {"ProvisionedConcurrentExecutions": 2},
+            },
+        )
+
+    def test_snapstart_disabled_with_provisioned_concurrency(
+        self, prod_template: Template
+    ) -> None:
+        functions = prod_template.find_resources("AWS::Lambda::Function")
+        assert all("SnapStart" not in r["Properties"] for r in functions.values())
 
-    def test_lambda_memory_size_prod(self) -> None:
-        template = _synth_template(_prod_config())
-        template.has_resource_properties(
+    def test_lambda_memory_size_prod(self, prod_template: Template) -> None:
+        prod_template.has_resource_properties(
             "AWS::Lambda::Function",
             {"MemorySize": 1024},
         )
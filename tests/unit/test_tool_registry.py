@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+from datetime import date
 from typing import Any
 
 import pytest
@@ -33,6 +35,13 @@ class TestToolDefinition:
         assert td.parameters == {}
         assert td.required_params == frozenset()
 
+    def test_defaults_are_shared_and_read_only(self) -> None:
+        first = ToolDefinition(name="a", description="", handler=_echo_tool)
+        second = ToolDefinition(name="b", description="", handler=_echo_tool)
+        assert first.parameters is second.parameters
+        with pytest.raises(TypeError):
+            first.parameters["type"] = "object"  # type: ignore[index]
+
 
 class TestToolInvocation:
     """Tests for ToolInvocation dataclass."""
@@ -51,6 +60,18 @@ class TestToolInvocation:
         assert d["status"] == "success"
         assert d["durationMs"] == 42.5
 
+    def test_to_json_matches_to_dict(self) -> None:
+        inv = ToolInvocation(
+            tool_name="test",
+            parameters={"when": date(2026, 1, 1), 1: "int key"},
+            status="success",
+            result="ok",
+        )
+        assert json.loads(inv.to_json()) == {
+            **inv.to_dict(),
+            "parameters": {"when": "2026-01-01", "1": "int key"},
+        }
+
 
 class TestToolRegistry:
     """Tests for ToolRegistry class."""
@@ -74,6 +95,7 @@ class TestToolRegistry:
         tool = reg.get_tool("my_tool")
         assert tool.name == "my_tool"
         assert tool.description == "My tool"
+        assert reg.get_tool("my_tool") is tool
 
     def test_get_tool_not_found(self) -> None:
         reg = ToolRegistry()
@@ -86,6 +108,27 @@ class TestToolRegistry:
         reg.unregister("tool_x")
         assert "tool_x" not in reg.tool_names
 
+    def test_unregister_keeps_later_tools_addressable(self) -> None:
+        reg = ToolRegistry()
+        reg.register("first", _echo_tool, description="1")
+        reg.register("second", _failing_tool, description="2")
+        reg.register("third", _echo_tool, description="3")
+        reg.unregister("first")
+
+        assert reg.get_tool("third").description == "3"
+        assert reg.get_strands_tools() == [_failing_tool, _echo_tool]
+        assert [d["name"] for d in reg.get_tool_definitions_for_agent()] == ["second", "third"]
+
+    def test_register_existing_name_replaces_in_place(self) -> None:
+        reg = ToolRegistry()
+        reg.register("tool", _echo_tool, description="old")
+        reg.register("other", _echo_tool)
+        reg.register("tool", _failing_tool, description="new")
+
+        assert reg.get_tool("tool").description == "new"
+        assert reg.get_tool("tool").handler is _failing_tool
+        assert reg.get_strands_tools() == [_failing_tool, _echo_tool]
+
     def test_unregister_missing_raises(self) -> None:
         reg = ToolRegistry()
         with pytest.raises(ToolNotFoundError):
@@ -110,6 +153,11 @@ class TestToolRegistry:
         with pytest.raises(ToolValidationError, match="missing required"):
             reg.validate_parameters("tool", {"a": 1})
 
+    def test_validate_parameters_unknown_tool_raises(self) -> None:
+        reg = ToolRegistry()
+        with pytest.raises(ToolNotFoundError):
+            reg.validate_parameters("missing", {})
+
     def test_execute_success(self) -> None:
         reg = ToolRegistry()
         reg.register("echo", _echo_tool)
@@ -152,6 +200,30 @@ class TestToolRegistry:
         assert len(defs) == 1
         assert defs[0]["name"] == "tool1"
         assert defs[0]["description"] == "First tool"
+        assert reg.get_tool_definitions_for_agent() is defs
+
+    def test_tool_definitions_cache_invalidated_on_change(self) -> None:
+        reg = ToolRegistry()
+        reg.register("tool1", _echo_tool, description="First tool")
+        before = reg.get_tool_definitions_for_agent()
+
+        reg.register("tool2", _echo_tool)
+        after = reg.get_tool_definitions_for_agent()
+        assert after is not before
+        assert [d["name"] for d in after] == ["tool1", "tool2"]
+        assert [d["name"] for d in before] == ["tool1"]
+
+        reg.unregister("tool1")
+        assert [d["name"] for d in reg.get_tool_definitions_for_agent()] == ["tool2"]
+
+    def test_tool_definitions_are_read_only(self) -> None:
+        reg = ToolRegistry()
+        reg.register("tool1", _echo_tool)
+
+        defs = reg.get_tool_definitions_for_agent()
+        with pytest.raises(AttributeError):
+            defs.append({"name": "injected"})  # type: ignore[attr-defined]
+        assert [d["name"] for d in reg.get_tool_definitions_for_agent()] == ["tool1"]
 
     def test_get_strands_tools(self) -> None:
         reg = ToolRegistry()
@@ -162,6 +234,15 @@ class TestToolRegistry:
         assert len(tools) == 2
         assert _echo_tool in tools
 
+    def test_invocation_log_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TOOL_LOG_MAX", "2")
+        reg = ToolRegistry()
+        reg.register("echo", _echo_tool)
+        for i in range(3):
+            reg.execute("echo", {"i": i})
+
+        assert [inv.parameters["i"] for inv in reg.invocation_log] == [1, 2]
+
     def test_clear_invocation_log(self) -> None:
         reg = ToolRegistry()
         reg.register("echo", _echo_tool)